@@ -5,5 +5,6 @@ This package contains data models for equipment, batteries, and solar panels.
 """
 
 from .equipment import Equipment, EquipmentFactory
+from .results import CalcResult
 
-__all__ = ["Equipment", "EquipmentFactory"]
+__all__ = ["Equipment", "EquipmentFactory", "CalcResult"]
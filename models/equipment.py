@@ -5,7 +5,9 @@ This module contains the Equipment class and EquipmentFactory for managing
 electrical equipment and their power consumption profiles.
 """
 
-from typing import Optional
+import weakref
+from typing import Any, Optional
+import numpy as np
 import pandas as pd
 
 
@@ -20,7 +22,43 @@ class Equipment:
         start_hour (int): Hour when equipment starts (0-23)
         end_hour (int): Hour when equipment ends (0-23)
     """
-    
+
+    # Fixed-offset attribute storage instead of a per-instance __dict__:
+    # roughly halves the footprint of large equipment libraries and
+    # speeds up the attribute reads that dominate get_hourly_consumption
+    # and df_datas. __weakref__ stays, as the flyweight pool below holds
+    # instances through weak references.
+    __slots__ = ("name", "power", "time", "start_hour", "end_hour", "__weakref__")
+
+    # Flyweight pool: identical specs share one instance across factory
+    # rebuilds (sample data, configuration loads). Weak values let unused
+    # instances be garbage collected once no factory references them.
+    _pool: "weakref.WeakValueDictionary[tuple, Equipment]" = weakref.WeakValueDictionary()
+
+    @classmethod
+    def from_spec(cls, name: str, power: int, time: float, start_hour: int = 0) -> "Equipment":
+        """
+        Get a pooled Equipment instance for the given spec.
+
+        Returns the cached instance when an identical (name, power, time,
+        start_hour) spec was already created, avoiding repeated allocations
+        on Streamlit reruns.
+
+        Args:
+            name: Name of the equipment
+            power: Power consumption in Watts
+            time: Daily usage time in hours
+            start_hour: Hour when equipment starts (0-23)
+
+        Returns:
+            Equipment: Shared instance for this spec
+        """
+        key = (name, power, time, start_hour)
+        equipment = cls._pool.get(key)
+        if equipment is None:
+            equipment = cls._pool.setdefault(key, cls(*key))
+        return equipment
+
     def __init__(
         self, 
         name: str, 
@@ -58,35 +96,40 @@ class Equipment:
         """
         return self.power * self.time
     
-    def get_hourly_consumption(self) -> list[float]:
+    def get_hourly_consumption(self) -> np.ndarray:
         """
         Get hourly consumption distribution for 24 hours.
-        
+
         Distributes the equipment's power consumption across the hours
-        it is active, handling partial hours correctly.
-        
+        it is active, handling partial hours correctly. The full hours
+        are written with at most two slice assignments (one when the
+        schedule wraps past midnight) instead of a per-hour Python loop.
+
         Returns:
-            list[float]: List of 24 values representing power consumption 
-                        for each hour of the day (Watts)
+            np.ndarray: 24 values representing power consumption for
+                        each hour of the day (Watts)
         """
-        hourly = [0.0] * 24
-        
+        hourly = np.zeros(24)
+
         # Simple distribution: divide power equally across usage hours
         if self.time > 0:
-            hours_used = self.time
-            current_hour = self.start_hour
-            remaining_time = hours_used
-            
-            while remaining_time > 0:
-                if remaining_time >= 1:
-                    hourly[current_hour % 24] += self.power
-                    remaining_time -= 1
-                else:
-                    # Partial hour
-                    hourly[current_hour % 24] += self.power * remaining_time
-                    remaining_time = 0
-                current_hour += 1
-        
+            whole_days, full_hours = divmod(int(self.time), 24)
+            if whole_days:
+                hourly += self.power * whole_days
+
+            start = self.start_hour % 24
+            end = start + full_hours
+            if end <= 24:
+                hourly[start:end] += self.power
+            else:
+                # Schedule wraps past midnight
+                hourly[start:] += self.power
+                hourly[:end - 24] += self.power
+
+            fraction = self.time - int(self.time)
+            if fraction > 0:
+                hourly[end % 24] += self.power * fraction
+
         return hourly
 
     def __repr__(self) -> str:
@@ -112,6 +155,22 @@ class EquipmentFactory:
     def __init__(self):
         """Initialize an empty EquipmentFactory."""
         self._equipments: list[Equipment] = []
+        # Maps equipment name to its index in self._equipments for O(1) deletion
+        self._name_to_idx: dict[str, int] = {}
+        # Cached aggregates, invalidated whenever the equipment list changes
+        self._energy_cache: Optional[float] = None
+        self._power_cache: Optional[float] = None
+        self._fingerprint_cache: Optional[int] = None
+        self._profile_cache: Optional[np.ndarray] = None
+        self._columns_cache: Optional[dict[str, Any]] = None
+
+    def _invalidate_caches(self) -> None:
+        """Drop cached aggregates after the equipment list changed."""
+        self._energy_cache = None
+        self._power_cache = None
+        self._fingerprint_cache = None
+        self._profile_cache = None
+        self._columns_cache = None
 
     def add_equipment(
         self, 
@@ -132,11 +191,12 @@ class EquipmentFactory:
         Raises:
             ValueError: If equipment with same name already exists
         """
-        new_equipment = Equipment(name, power, time, start_hour)
-        if new_equipment in self._equipments:
+        if name in self._name_to_idx:
             # Note: Translation should be passed from outside
             raise ValueError(f"Equipment '{name}' already exists")
-        self._equipments.append(new_equipment)
+        self._name_to_idx[name] = len(self._equipments)
+        self._equipments.append(Equipment.from_spec(name, power, time, start_hour))
+        self._invalidate_caches()
 
     def get_equipments(self) -> list[Equipment]:
         """
@@ -147,78 +207,153 @@ class EquipmentFactory:
         """
         return self._equipments
 
+    def columns(self) -> dict[str, Any]:
+        """
+        Get the equipment collection as parallel per-field columns.
+
+        Structure-of-arrays view of the equipment list: a names list plus
+        one contiguous NumPy array per numeric field, built in a single
+        pass and cached until the list changes. Consumers (DataFrame
+        build, config save, charts) read whole columns instead of pulling
+        attributes off N objects one at a time.
+
+        Returns:
+            dict: Keys "name" (list[str]) and "power", "time",
+                  "start_hour", "end_hour" (np.ndarray)
+        """
+        if self._columns_cache is None:
+            eqs = self._equipments
+            count = len(eqs)
+            # power stays integer: it is declared int on Equipment, and a
+            # float dtype here would leak floats into saved configs and
+            # back into the edit form's integer number_input (the mixed
+            # numeric types crash documented in BUGFIX_NUMERIC_TYPES.md).
+            self._columns_cache = {
+                "name": [e.name for e in eqs],
+                "power": np.fromiter((e.power for e in eqs), np.int64, count),
+                "time": np.fromiter((e.time for e in eqs), np.float64, count),
+                "start_hour": np.fromiter((e.start_hour for e in eqs), np.int64, count),
+                "end_hour": np.fromiter((e.end_hour for e in eqs), np.int64, count),
+            }
+        return self._columns_cache
+
     def df_datas(self) -> pd.DataFrame:
         """
         Get all equipments as a pandas DataFrame.
-        
+
         Returns:
-            pd.DataFrame: DataFrame with columns: Name, Power, Usage Time, 
+            pd.DataFrame: DataFrame with columns: Name, Power, Usage Time,
                          Schedule, Energie
         """
-        datas = {
-            "Name": [],
-            "Power": [],
-            "Usage Time": [],
-            "Schedule": [],
-            "Energie": []
-        }
-        for equipment in self._equipments:
-            datas["Name"].append(equipment.name)
-            datas["Power"].append(equipment.power)
-            datas["Usage Time"].append(equipment.time)
-            datas["Schedule"].append(f"{equipment.start_hour}h-{equipment.end_hour}h")
-            datas["Energie"].append(equipment.daily_energy_consumption())
-
-        return pd.DataFrame(datas)
+        cols = self.columns()
+        return pd.DataFrame({
+            "Name": cols["name"],
+            "Power": cols["power"],
+            "Usage Time": cols["time"],
+            "Schedule": [
+                f"{start}h-{end}h"
+                for start, end in zip(cols["start_hour"].tolist(), cols["end_hour"].tolist())
+            ],
+            "Energie": cols["power"] * cols["time"],
+        })
 
     def total_energy_consumption(self) -> float:
         """
         Calculate the total energy consumption of all equipments.
-        
+
+        The result is cached until the equipment list changes, so repeated
+        calls within one render are O(1).
+
         Returns:
             float: Total daily energy consumption in Watt-hours (Wh)
         """
-        return sum(equipment.daily_energy_consumption() for equipment in self._equipments)
+        if self._energy_cache is None:
+            self._energy_cache = sum(
+                equipment.daily_energy_consumption() for equipment in self._equipments
+            )
+        return self._energy_cache
 
     def total_power(self) -> float:
         """
         Calculate the total power of all equipments.
-        
+
+        The result is cached until the equipment list changes, so repeated
+        calls within one render are O(1).
+
         Returns:
             float: Total power in Watts (W)
         """
-        return sum(equipment.power for equipment in self._equipments)
+        if self._power_cache is None:
+            self._power_cache = sum(equipment.power for equipment in self._equipments)
+        return self._power_cache
     
-    def get_hourly_profile(self) -> list[float]:
+    def fingerprint(self) -> int:
+        """
+        Get a hash of the current equipment specs.
+
+        The value changes whenever the equipment list changes, so it can
+        serve as a cache key for DataFrames and charts derived from the
+        factory. Cached until the equipment list changes.
+
+        Returns:
+            int: Hash of the (name, power, time, start_hour) spec tuples
+        """
+        if self._fingerprint_cache is None:
+            self._fingerprint_cache = hash(tuple(
+                (e.name, e.power, e.time, e.start_hour) for e in self._equipments
+            ))
+        return self._fingerprint_cache
+
+    def get_hourly_profile(self) -> np.ndarray:
         """
         Get the total hourly consumption profile for all equipments.
-        
-        Aggregates the hourly consumption of all equipment to show
-        the total power draw for each hour of the day.
-        
+
+        Stacks the per-equipment hourly rows into an (E, 24) matrix and
+        sums it along axis 0 in one vectorized call, instead of E x 24
+        Python-level additions. The result is cached until the equipment
+        list changes, so the chart and metric call sites share one
+        computation.
+
         Returns:
-            list[float]: List of 24 values representing total power consumption 
+            np.ndarray: 24 values representing total power consumption
                         for each hour (Watts)
         """
-        hourly_total = [0.0] * 24
-        for equipment in self._equipments:
-            hourly = equipment.get_hourly_consumption()
-            for i in range(24):
-                hourly_total[i] += hourly[i]
-        return hourly_total
+        if self._profile_cache is None:
+            if self._equipments:
+                self._profile_cache = np.sum(
+                    [equipment.get_hourly_consumption() for equipment in self._equipments],
+                    axis=0
+                )
+            else:
+                self._profile_cache = np.zeros(24)
+        return self._profile_cache
 
     def delete_equipment(self, equipment: Equipment) -> None:
         """
         Delete an equipment from the factory.
-        
+
+        Uses the name index for an O(1) swap-pop instead of list.remove,
+        so bulk deletions don't shift the trailing elements.
+
         Args:
             equipment: Equipment object to delete
+
+        Raises:
+            KeyError: If equipment is not in the factory
         """
-        self._equipments.remove(equipment)
+        idx = self._name_to_idx.pop(equipment.name)
+        last = self._equipments.pop()
+        if idx != len(self._equipments):
+            # Move the last equipment into the freed slot
+            self._equipments[idx] = last
+            self._name_to_idx[last.name] = idx
+        self._invalidate_caches()
 
     def delete_all_equipments(self) -> None:
         """Delete all equipments from the factory."""
         self._equipments.clear()
+        self._name_to_idx.clear()
+        self._invalidate_caches()
 
     def is_empty(self) -> bool:
         """
@@ -250,23 +385,26 @@ class EquipmentFactory:
         Raises:
             ValueError: If equipment not found
         """
-        if old_equipment in self._equipments:
-            index = self._equipments.index(old_equipment)
-            self._equipments[index] = Equipment(new_name, new_power, new_time, new_start_hour)
-        else:
+        index = self._name_to_idx.get(old_equipment.name)
+        if index is None:
             raise ValueError(f"Equipment {old_equipment.name} not found.")
+        self._equipments[index] = Equipment.from_spec(new_name, new_power, new_time, new_start_hour)
+        del self._name_to_idx[old_equipment.name]
+        self._name_to_idx[new_name] = index
+        self._invalidate_caches()
 
     def get_equipment_by_name(self, name: str) -> Optional[Equipment]:
         """
         Get an equipment by its name.
         
+        Uses the name index, so the lookup is O(1) regardless of how
+        many equipments the factory holds.
+
         Args:
             name: Name of the equipment to find
-            
+
         Returns:
             Equipment | None: Equipment object if found, None otherwise
         """
-        for equipment in self._equipments:
-            if equipment.name == name:
-                return equipment
-        return None
+        index = self._name_to_idx.get(name)
+        return self._equipments[index] if index is not None else None
@@ -0,0 +1,62 @@
+"""
+Result models for Solar Solution.
+
+This module contains the CalcResult container that carries the system
+sizing results from the Calculations page to the Report page.
+"""
+
+from dataclasses import dataclass
+from typing import Any, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from utils.calculations import CableSpec, RegulatorSpec
+
+
+@dataclass(frozen=True, slots=True)
+class CalcResult:
+    """
+    Immutable snapshot of one complete system calculation.
+
+    Replaces the former ``calculation_results`` dict in session state.
+    Attribute access goes through C-level slot descriptors instead of
+    dict hashing (the report page reads these fields ~80 times per
+    render), field-wise ``__eq__`` keeps the write-back guard on the
+    Calculations page working, and the frozen contract documents that
+    results are recomputed, never mutated in place.
+
+    Attributes:
+        daily_energy: Total daily consumption in Watt-hours
+        total_power: Total equipment power in Watts
+        num_batteries: Number of batteries required
+        battery_voltage: Battery voltage in Volts
+        battery_capacity: Battery capacity in Amp-hours
+        battery_type: Battery chemistry ("Lead-Acid" or "Lithium")
+        discharge_depth: Depth of discharge (0-1)
+        autonomy_days: Days of autonomy
+        num_panels: Number of solar panels required
+        pv_power: Power of one panel in Watts
+        total_pv_power: Total PV power in Watts
+        sun_hours: Peak sun hours per day
+        regulator_type: Charge controller type ("MPPT" or "PWM")
+        regulator_specs: Controller sizing results from calculate_regulator
+        cable_specs: Cable sizing results from calculate_cable_section
+        derived: Figures precomputed for the report (storage, production,
+            surplus, panel area)
+    """
+
+    daily_energy: float
+    total_power: float
+    num_batteries: int
+    battery_voltage: int
+    battery_capacity: int
+    battery_type: str
+    discharge_depth: float
+    autonomy_days: int
+    num_panels: int
+    pv_power: int
+    total_pv_power: int
+    sun_hours: float
+    regulator_type: str
+    regulator_specs: "RegulatorSpec"
+    cable_specs: "CableSpec"
+    derived: dict[str, Any]
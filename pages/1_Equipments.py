@@ -13,7 +13,12 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from models.equipment import EquipmentFactory
 from utils.translations import load_translation
 from utils.storage import load_equipment_library, get_library_categories, save_configuration, get_saved_configurations, load_configuration, delete_configuration
-from utils.charts import create_consumption_pie_chart, create_power_time_chart, create_hourly_profile_chart
+from utils.charts import (
+    create_consumption_pie_chart,
+    create_power_time_chart,
+    create_hourly_profile_chart,
+    prepare_chart_data
+)
 
 # Page configuration
 st.set_page_config(
@@ -308,16 +313,19 @@ else:
         "⏰ " + t.get("Hourly", {}).get("chart_title", "Hourly Profile")
     ])
     
+    # One pass over the factory feeds all three charts
+    chart_data = prepare_chart_data(factory)
+
     with tab1:
-        fig1 = create_consumption_pie_chart(factory, t)
+        fig1 = create_consumption_pie_chart(factory, t, data=chart_data)
         st.plotly_chart(fig1, width="stretch")
-    
+
     with tab2:
-        fig2 = create_power_time_chart(factory, t)
+        fig2 = create_power_time_chart(factory, t, data=chart_data)
         st.plotly_chart(fig2, width="stretch")
-    
+
     with tab3:
-        fig3 = create_hourly_profile_chart(factory, t)
+        fig3 = create_hourly_profile_chart(factory, t, data=chart_data)
         st.plotly_chart(fig3, width="stretch")
     
     st.markdown("---")
@@ -3,22 +3,86 @@ Page 2: System Calculations
 Calculate batteries, solar panels, regulator, and cables
 """
 import streamlit as st
-import json
-from pathlib import Path
-import sys
 import math
+from dataclasses import replace
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
+# The repo root is already importable: Streamlit puts the main script's
+# directory (where app.py lives) on sys.path, and models/ and utils/ are
+# regular packages with __init__.py. No per-rerun path mutation needed.
 from models.equipment import EquipmentFactory
-from utils.translations import load_translation
+from models.results import CalcResult
+from utils.translations import load_translation, flatten_translation
 from utils.calculations import (
     battery_needed, panel_needed,
-    calculate_system_cost, calculate_roi, calculate_co2_impact,
     calculate_regulator, calculate_cable_section
 )
 
+# Memoized wrappers: Streamlit re-executes the whole script on every widget
+# interaction, so cache the pure calculation functions on their scalar inputs.
+# Reruns triggered by unrelated widgets then skip the recomputation entirely.
+# The economics helpers are imported and wrapped inside their expander, the
+# only place they are used.
+_cached_battery_needed = st.cache_data(max_entries=128)(battery_needed)
+_cached_panel_needed = st.cache_data(max_entries=128)(panel_needed)
+_cached_regulator = st.cache_data(max_entries=128)(calculate_regulator)
+_cached_cable_section = st.cache_data(max_entries=128)(calculate_cable_section)
+
+# Hold the parsed translation dict once per process and share it across
+# sessions; bounded at one entry per available language.
+_load_translation = st.cache_resource(load_translation)
+
+# Static bodies of the detail expanders, built once at import. Reruns only
+# fill in the precomputed values instead of rebuilding the multi-line
+# f-strings (and redoing their divisions) from scratch.
+_BATTERY_DETAILS_TMPL = """
+    - **Total Capacity:** {total_capacity_ah} Ah ({total_energy_wh:.0f} Wh usable)
+    - **Total Energy Storage:** {total_storage_wh:.0f} Wh
+    - **Energy per battery:** {energy_per_battery:.0f} Wh
+    - **Usable per battery:** {usable_per_battery:.0f} Wh
+    - **Safety margin:** Autonomy for {autonomy_days} days
+    """
+
+# Summary box: one flex-layout HTML payload instead of three separate
+# markdown ops, so a rerun issues a single render-tree element.
+_SUMMARY_TMPL = """
+<div style='display:flex;gap:2em'>
+<div style='flex:1'>
+<strong>⚡ Consumption</strong>
+<ul>
+<li>Daily: {daily_energy:.0f} Wh</li>
+<li>Total Power: {total_power:.0f} W</li>
+<li>Equipment: {equipment_count}</li>
+</ul>
+</div>
+<div style='flex:1'>
+<strong>🔋 System Components</strong>
+<ul>
+<li>Batteries: {num_batteries} × {battery_capacity}Ah {battery_voltage}V</li>
+<li>Solar Panels: {num_panels} × {pv_power}W</li>
+<li>Controller: {regulator_type} {recommended_current_ceil}A</li>
+<li>Cable: {cable_section:.1f}mm² (fuse: {fuse_rating}A)</li>
+</ul>
+</div>
+<div style='flex:1'>
+<strong>✅ Recommendations</strong>
+<ul>
+<li>Battery Type: {battery_type}</li>
+<li>DoD: {dod_percent:.0f}%</li>
+<li>Autonomy: {autonomy_days} days</li>
+<li>Max Voltage Drop: {max_voltage_drop}%</li>
+</ul>
+</div>
+</div>
+"""
+
+_PV_DETAILS_TMPL = """
+    - **Total PV Power:** {total_pv_power} W ({total_pv_kw:.2f} kW)
+    - **Daily Production:** {daily_production:.0f} Wh ({daily_production_kwh:.2f} kWh)
+    - **Daily Consumption:** {daily_energy:.0f} Wh ({daily_energy_kwh:.2f} kWh)
+    - **Surplus:** {surplus:.0f} Wh ({surplus_percent:.1f}%)
+    - **Panel Area (approx):** {panel_area:.1f} m² (assuming 1.7m² per panel)
+    """
+
 # Page configuration
 st.set_page_config(
     page_title="Calculations - Solar Solution",
@@ -28,7 +92,7 @@ st.set_page_config(
 
 # Initialize session state
 if "language" not in st.session_state:
-    st.session_state["language"] = load_translation("en")
+    st.session_state["language"] = _load_translation("en")
     st.session_state["current_lang"] = "en"
 
 if "equipments" not in st.session_state:
@@ -37,34 +101,44 @@ if "equipments" not in st.session_state:
 t = st.session_state["language"]
 factory = st.session_state["equipments"]
 
-# Language selector in sidebar
+# Flat label map: one dict lookup per label instead of two chained .get
+# calls with a throwaway {} fallback. Rebuilt only on language change.
+if st.session_state.get("_flat_translation_lang") != st.session_state.get("current_lang", "en"):
+    st.session_state["_flat_translation"] = flatten_translation(t)
+    st.session_state["_flat_translation_lang"] = st.session_state.get("current_lang", "en")
+tf = st.session_state["_flat_translation"]
+
+# Language selector in sidebar. The on_change callback only fires on an
+# actual selection change and Streamlit reruns afterwards by itself, so
+# the per-rerun comparison and the explicit st.rerun() go away.
+def _on_language_change() -> None:
+    lang = st.session_state["lang_selector_calc"]
+    if lang != st.session_state.get("current_lang", "en"):
+        st.session_state["current_lang"] = lang
+        st.session_state["language"] = _load_translation(lang)
+
+
 with st.sidebar:
     st.markdown("### :material/settings: Settings")
-    lang = st.selectbox(
-        "🌍 Language", 
+    st.selectbox(
+        "🌍 Language",
         ["en", "fr"],
         index=0 if st.session_state.get("current_lang", "en") == "en" else 1,
-        key="lang_selector_calc"
+        key="lang_selector_calc",
+        on_change=_on_language_change
     )
-    
-    if lang != st.session_state.get("current_lang", "en"):
-        st.session_state["current_lang"] = lang
-        st.session_state["language"] = load_translation(lang)
-        st.rerun()
 
 # Top Navigation
+# Single-element columns use the column handle directly: one call per
+# widget instead of an extra container context per rerun.
 col1, col2, col3, col4 = st.columns(4)
-with col1:
-    if st.button(":material/home: " + t.get("nav_home", "Home"), width="stretch", key="nav_home_calc"):
-        st.switch_page("app.py")
-with col2:
-    if st.button(":material/bolt: " + t.get("nav_equipments", "Equipments"), width="stretch", key="nav_eq_calc"):
-        st.switch_page("pages/1_Equipments.py")
-with col3:
-    st.button(":material/battery_charging_full: " + t.get("nav_calculations", "Calculations"), width="stretch", disabled=True, type="primary", key="nav_calc_calc")
-with col4:
-    if st.button(":material/description: " + t.get("nav_report", "Report"), width="stretch", key="nav_report_calc"):
-        st.switch_page("pages/3_Report.py")
+if col1.button(":material/home: " + t.get("nav_home", "Home"), width="stretch", key="nav_home_calc"):
+    st.switch_page("app.py")
+if col2.button(":material/bolt: " + t.get("nav_equipments", "Equipments"), width="stretch", key="nav_eq_calc"):
+    st.switch_page("pages/1_Equipments.py")
+col3.button(":material/battery_charging_full: " + t.get("nav_calculations", "Calculations"), width="stretch", disabled=True, type="primary", key="nav_calc_calc")
+if col4.button(":material/description: " + t.get("nav_report", "Report"), width="stretch", key="nav_report_calc"):
+    st.switch_page("pages/3_Report.py")
 
 st.markdown("---")
 
@@ -73,7 +147,7 @@ st.title(":material/battery_charging_full: " + t.get("nav_calculations", "System
 
 # Check if equipment exists
 if factory.is_empty():
-    st.warning(":material/warning: " + t.get("Main", {}).get("no_equipment", "No equipment added. Please add equipment first."))
+    st.warning(":material/warning: " + tf.get("Main.no_equipment", "No equipment added. Please add equipment first."))
     if st.button("➕ " + t.get("nav_equipments", "Go to Equipments")):
         st.switch_page("pages/1_Equipments.py")
     st.stop()
@@ -83,74 +157,77 @@ daily_energy = factory.total_energy_consumption()
 total_power = factory.total_power()
 
 col1, col2 = st.columns(2)
-with col1:
-    st.metric(
-        label=":material/battery_charging_full: " + t.get("Main", {}).get("daily_consumption", "Daily Consumption"),
-        value=f"{daily_energy:.0f} Wh",
-        delta=f"{daily_energy/1000:.2f} kWh"
-    )
-with col2:
-    st.metric(
-        label=":material/bolt: " + t.get("Main", {}).get("converter_power", "Total Power"),
-        value=f"{total_power:.0f} W",
-        delta=f"{total_power/1000:.2f} kW"
-    )
+col1.metric(
+    label=":material/battery_charging_full: " + tf.get("Main.daily_consumption", "Daily Consumption"),
+    value=f"{daily_energy:.0f} Wh",
+    delta=f"{daily_energy/1000:.2f} kWh"
+)
+col2.metric(
+    label=":material/bolt: " + tf.get("Main.converter_power", "Total Power"),
+    value=f"{total_power:.0f} W",
+    delta=f"{total_power/1000:.2f} kW"
+)
 
 st.markdown("---")
 
 # Battery Configuration
-st.subheader(":material/battery_charging_full: " + t.get("Battery", {}).get("title", "Battery Configuration"))
+st.subheader(":material/battery_charging_full: " + tf.get("Battery.title", "Battery Configuration"))
 
-col1, col2 = st.columns(2)
+# Form debounces reruns: edits only re-execute the script on Apply,
+# instead of once per widget change while the user is still mid-edit.
+with st.form("battery_form"):
+    col1, col2 = st.columns(2)
 
-with col1:
-    battery_type = st.selectbox(
-        t.get("Battery", {}).get("type", "Battery Type"),
-        ["Lead-Acid", "Lithium"],
-        index=0,
-        key="battery_type"
-    )
-    
-    # Discharge depth based on battery type
-    default_dod = 0.5 if battery_type == "Lead-Acid" else 0.8
-    
-    battery_voltage = st.selectbox(
-        t.get("Battery", {}).get("voltage", "Battery Voltage (V)"),
-        [12, 24, 48],
-        index=0,
-        key="battery_voltage"
-    )
-    
-    battery_capacity = st.number_input(
-        t.get("Battery", {}).get("capacity", "Battery Capacity (Ah)"),
-        min_value=10,
-        value=200,
-        step=10,
-        key="battery_capacity"
-    )
+    with col1:
+        battery_type = st.selectbox(
+            tf.get("Battery.type", "Battery Type"),
+            ["Lead-Acid", "Lithium"],
+            index=0,
+            key="battery_type"
+        )
 
-with col2:
-    autonomy_days = st.number_input(
-        t.get("Battery", {}).get("autonomy", "Autonomy (days)"),
-        min_value=1,
-        max_value=7,
-        value=2,
-        step=1,
-        key="autonomy_days"
-    )
-    
-    discharge_depth = st.slider(
-        t.get("Battery", {}).get("dod", "Depth of Discharge (DoD)"),
-        min_value=0.3,
-        max_value=0.9,
-        value=default_dod,
-        step=0.05,
-        key="discharge_depth",
-        help="Lead-Acid: 50% | Lithium: 80%"
-    )
+        # Discharge depth based on battery type
+        default_dod = 0.5 if battery_type == "Lead-Acid" else 0.8
+
+        battery_voltage = st.selectbox(
+            tf.get("Battery.voltage", "Battery Voltage (V)"),
+            [12, 24, 48],
+            index=0,
+            key="battery_voltage"
+        )
+
+        battery_capacity = st.number_input(
+            tf.get("Battery.capacity", "Battery Capacity (Ah)"),
+            min_value=10,
+            value=200,
+            step=10,
+            key="battery_capacity"
+        )
+
+    with col2:
+        autonomy_days = st.number_input(
+            tf.get("Battery.autonomy", "Autonomy (days)"),
+            min_value=1,
+            max_value=7,
+            value=2,
+            step=1,
+            key="autonomy_days"
+        )
+
+        discharge_depth = st.slider(
+            tf.get("Battery.dod", "Depth of Discharge (DoD)"),
+            min_value=0.3,
+            max_value=0.9,
+            value=default_dod,
+            step=0.05,
+            key="discharge_depth",
+            help="Lead-Acid: 50% | Lithium: 80%"
+        )
+
+    st.form_submit_button(":material/check_circle: Apply")
 
 # Calculate batteries needed
-num_batteries = battery_needed(
+num_batteries = _cached_battery_needed(
     daily_energy_wh=daily_energy,
     battery_voltage=battery_voltage,
     battery_capacity_ah=battery_capacity,
@@ -158,50 +235,54 @@ num_batteries = battery_needed(
     discharge_depth=discharge_depth
 )
 
-st.success(f"**{t.get('Battery', {}).get('result', 'Batteries Needed')}: {num_batteries}**")
+st.success(f"**{tf.get('Battery.result', 'Batteries Needed')}: {num_batteries}**")
 
 # Detailed info
-with st.expander(":material/info: " + t.get("Battery", {}).get("details", "Battery Details")):
+with st.expander(":material/info: " + tf.get("Battery.details", "Battery Details")):
     total_capacity_ah = num_batteries * battery_capacity
-    total_energy_wh = total_capacity_ah * battery_voltage * discharge_depth
-    
-    st.markdown(f"""
-    - **Total Capacity:** {total_capacity_ah} Ah ({total_energy_wh:.0f} Wh usable)
-    - **Total Energy Storage:** {total_capacity_ah * battery_voltage:.0f} Wh
-    - **Energy per battery:** {battery_voltage * battery_capacity:.0f} Wh
-    - **Usable per battery:** {battery_voltage * battery_capacity * discharge_depth:.0f} Wh
-    - **Safety margin:** Autonomy for {autonomy_days} days
-    """)
+    energy_per_battery = battery_voltage * battery_capacity
+
+    st.markdown(_BATTERY_DETAILS_TMPL.format(
+        total_capacity_ah=total_capacity_ah,
+        total_energy_wh=total_capacity_ah * battery_voltage * discharge_depth,
+        total_storage_wh=total_capacity_ah * battery_voltage,
+        energy_per_battery=energy_per_battery,
+        usable_per_battery=energy_per_battery * discharge_depth,
+        autonomy_days=autonomy_days
+    ))
 
 st.markdown("---")
 
 # Solar Panel Configuration
-st.subheader(":material/wb_sunny: " + t.get("PV", {}).get("title", "Solar Panel Configuration"))
+st.subheader(":material/wb_sunny: " + tf.get("PV.title", "Solar Panel Configuration"))
 
-col1, col2 = st.columns(2)
+with st.form("pv_form"):
+    col1, col2 = st.columns(2)
 
-with col1:
-    pv_power = st.number_input(
-        t.get("PV", {}).get("power", "Panel Power (W)"),
-        min_value=50,
-        value=300,
-        step=50,
-        key="pv_power"
-    )
+    with col1:
+        pv_power = st.number_input(
+            tf.get("PV.power", "Panel Power (W)"),
+            min_value=50,
+            value=300,
+            step=50,
+            key="pv_power"
+        )
 
-with col2:
-    sun_hours = st.number_input(
-        t.get("PV", {}).get("sun_hours", "Peak Sun Hours"),
-        min_value=1.0,
-        max_value=10.0,
-        value=5.0,
-        step=0.5,
-        key="sun_hours",
-        help="Average daily peak sun hours in your location"
-    )
+    with col2:
+        sun_hours = st.number_input(
+            tf.get("PV.sun_hours", "Peak Sun Hours"),
+            min_value=1.0,
+            max_value=10.0,
+            value=5.0,
+            step=0.5,
+            key="sun_hours",
+            help="Average daily peak sun hours in your location"
+        )
+
+    st.form_submit_button(":material/check_circle: Apply")
 
 # Calculate panels needed
-num_panels = panel_needed(
+num_panels = _cached_panel_needed(
     daily_energy_wh=daily_energy,
     pv_power_w=pv_power,
     sun_hours=sun_hours
@@ -209,52 +290,57 @@ num_panels = panel_needed(
 
 total_pv_power = num_panels * pv_power
 
-st.success(f"**{t.get('PV', {}).get('result', 'Panels Needed')}: {num_panels}** ({total_pv_power} W total)")
+st.success(f"**{tf.get('PV.result', 'Panels Needed')}: {num_panels}** ({total_pv_power} W total)")
 
 # Detailed info
-with st.expander(":material/info: " + t.get("PV", {}).get("details", "Solar Panel Details")):
+with st.expander(":material/info: " + tf.get("PV.details", "Solar Panel Details")):
     daily_production = total_pv_power * sun_hours
     surplus = daily_production - daily_energy
     surplus_percent = (surplus / daily_energy * 100) if daily_energy > 0 else 0
-    
-    st.markdown(f"""
-    - **Total PV Power:** {total_pv_power} W ({total_pv_power/1000:.2f} kW)
-    - **Daily Production:** {daily_production:.0f} Wh ({daily_production/1000:.2f} kWh)
-    - **Daily Consumption:** {daily_energy:.0f} Wh ({daily_energy/1000:.2f} kWh)
-    - **Surplus:** {surplus:.0f} Wh ({surplus_percent:.1f}%)
-    - **Panel Area (approx):** {num_panels * 1.7:.1f} m² (assuming 1.7m² per panel)
-    """)
+
+    st.markdown(_PV_DETAILS_TMPL.format(
+        total_pv_power=total_pv_power,
+        total_pv_kw=total_pv_power / 1000,
+        daily_production=daily_production,
+        daily_production_kwh=daily_production / 1000,
+        daily_energy=daily_energy,
+        daily_energy_kwh=daily_energy / 1000,
+        surplus=surplus,
+        surplus_percent=surplus_percent,
+        panel_area=num_panels * 1.7
+    ))
 
 st.markdown("---")
 
 # Charge Controller
-st.subheader(":material/settings: " + t.get("Regulator", {}).get("title", "Charge Controller"))
+st.subheader(":material/settings: " + tf.get("Regulator.title", "Charge Controller"))
 
 col1, col2 = st.columns(2)
 
-with col1:
-    regulator_type = st.selectbox(
-        t.get("Regulator", {}).get("type", "Controller Type"),
-        ["MPPT", "PWM"],
-        index=0,
-        key="regulator_type",
-        help="MPPT: More efficient (98%), PWM: Less efficient (85%)"
-    )
+regulator_type = col1.selectbox(
+    tf.get("Regulator.type", "Controller Type"),
+    ["MPPT", "PWM"],
+    index=0,
+    key="regulator_type",
+    help="MPPT: More efficient (98%), PWM: Less efficient (85%)"
+)
 
-regulator_specs = calculate_regulator(
+regulator_specs = _cached_regulator(
     pv_power=total_pv_power,
     battery_voltage=battery_voltage,
     regulator_type=regulator_type
 )
 
-with col2:
-    recommended_current = float(regulator_specs['recommended_current'])
-    st.metric(
-        t.get("Regulator", {}).get("current", "Recommended Current"),
-        f"{math.ceil(recommended_current)} A"
-    )
+# Computed once; reused by the metric, the cable default and the summary
+recommended_current = float(regulator_specs['recommended_current'])
+recommended_current_ceil = math.ceil(recommended_current)
 
-with st.expander(":material/info: " + t.get("Regulator", {}).get("details", "Controller Details")):
+col2.metric(
+    tf.get("Regulator.current", "Recommended Current"),
+    f"{recommended_current_ceil} A"
+)
+
+with st.expander(":material/info: " + tf.get("Regulator.details", "Controller Details")):
     st.markdown(f"""
     - **Type:** {regulator_specs['type']}
     - **Nominal Current:** {regulator_specs['nominal_current']:.1f} A
@@ -267,301 +353,362 @@ with st.expander(":material/info: " + t.get("Regulator", {}).get("details", "Con
 st.markdown("---")
 
 # Cable Sizing
-st.subheader(":material/power: " + t.get("Cable", {}).get("title", "Cable Sizing"))
-
-col1, col2, col3 = st.columns(3)
-
-with col1:
-    cable_current = st.number_input(
-        t.get("Cable", {}).get("current", "Current (A)"),
-        min_value=1.0,
-        value=float(regulator_specs['recommended_current']),
-        step=1.0,
-        key="cable_current"
-    )
-
-with col2:
-    cable_length = st.number_input(
-        t.get("Cable", {}).get("length", "Cable Length (m)"),
-        min_value=1.0,
-        value=10.0,
-        step=1.0,
-        key="cable_length",
-        help="One-way distance"
-    )
-
-with col3:
-    max_voltage_drop = st.slider(
-        t.get("Cable", {}).get("max_drop", "Max Voltage Drop (%)"),
-        min_value=1.0,
-        max_value=5.0,
-        value=3.0,
-        step=0.5,
-        key="max_drop"
+st.subheader(":material/power: " + tf.get("Cable.title", "Cable Sizing"))
+
+
+def _render_summary(slot) -> None:
+    """
+    Render the System Summary box into a placeholder from stored results.
+
+    Reads everything from the CalcResult in session state, so the full
+    script and the cable fragment can both redraw the summary and always
+    show the same figures.
+    """
+    results = st.session_state.get("calculation_results")
+    if results is None:
+        return
+    slot.markdown(_SUMMARY_TMPL.format(
+        daily_energy=results.daily_energy,
+        total_power=results.total_power,
+        equipment_count=len(st.session_state["equipments"].get_equipments()),
+        num_batteries=results.num_batteries,
+        battery_capacity=results.battery_capacity,
+        battery_voltage=results.battery_voltage,
+        num_panels=results.num_panels,
+        pv_power=results.pv_power,
+        regulator_type=results.regulator_type,
+        recommended_current_ceil=results.derived["recommended_current_ceil"],
+        cable_section=results.cable_specs["cable_section"],
+        fuse_rating=results.cable_specs["fuse_rating"],
+        battery_type=results.battery_type,
+        dod_percent=results.discharge_depth * 100,
+        autonomy_days=results.autonomy_days,
+        # The max-drop slider lives in the cable fragment; read it back
+        # through its widget key.
+        max_voltage_drop=st.session_state["max_drop"]
+    ), unsafe_allow_html=True)
+
+
+@st.fragment
+def _cable_sizing_section(battery_voltage: int, default_current: float) -> None:
+    """
+    Cable sizing inputs and results, isolated in a fragment.
+
+    Changing a cable input reruns only this block instead of the whole
+    page; the computed specs are published via session state for the
+    summary and the report.
+    """
+    with st.form("cable_form"):
+        col1, col2, col3 = st.columns(3)
+
+        with col1:
+            cable_current = st.number_input(
+                tf.get("Cable.current", "Current (A)"),
+                min_value=1.0,
+                value=default_current,
+                step=1.0,
+                key="cable_current"
+            )
+
+        with col2:
+            cable_length = st.number_input(
+                tf.get("Cable.length", "Cable Length (m)"),
+                min_value=1.0,
+                value=10.0,
+                step=1.0,
+                key="cable_length",
+                help="One-way distance"
+            )
+
+        with col3:
+            max_voltage_drop = st.slider(
+                tf.get("Cable.max_drop", "Max Voltage Drop (%)"),
+                min_value=1.0,
+                max_value=5.0,
+                value=3.0,
+                step=0.5,
+                key="max_drop"
+            )
+
+        st.form_submit_button(":material/check_circle: Apply")
+
+    cable_specs = _cached_cable_section(
+        current=cable_current,
+        length=cable_length,
+        voltage=battery_voltage,
+        max_drop_percent=max_voltage_drop
     )
 
-cable_specs = calculate_cable_section(
-    current=cable_current,
-    length=cable_length,
-    voltage=battery_voltage,
-    max_drop_percent=max_voltage_drop
-)
-
-col1, col2, col3 = st.columns(3)
+    col1, col2, col3 = st.columns(3)
 
-with col1:
-    st.metric(
-        t.get("Cable", {}).get("section", "Cable Section"),
+    col1.metric(
+        tf.get("Cable.section", "Cable Section"),
         f"{cable_specs['cable_section']:.1f} mm²"
     )
-
-with col2:
-    st.metric(
-        t.get("Cable", {}).get("actual_drop", "Actual Drop"),
+    col2.metric(
+        tf.get("Cable.actual_drop", "Actual Drop"),
         f"{cable_specs['actual_drop_percent']:.2f}%",
         delta=f"{cable_specs['actual_drop_volts']:.2f}V"
     )
-
-with col3:
-    st.metric(
-        t.get("Cable", {}).get("fuse", "Fuse Rating"),
+    col3.metric(
+        tf.get("Cable.fuse", "Fuse Rating"),
         f"{cable_specs['fuse_rating']} A"
     )
 
-with st.expander(":material/info: " + t.get("Cable", {}).get("details", "Cable Details")):
-    st.markdown(f"""
-    **Calculation Details:**
-    - Current: {cable_specs['current']} A
-    - Cable length: {cable_length} m (one-way)
-    - Total circuit length: {cable_length * 2} m (round-trip)
-    - System voltage: {battery_voltage} V
-    - Maximum acceptable drop: {max_voltage_drop}% ({battery_voltage * max_voltage_drop/100:.2f} V)
-    - **Selected cable section: {cable_specs['cable_section']:.1f} mm²**
-    - **Actual voltage drop: {cable_specs['actual_drop_volts']:.2f} V ({cable_specs['actual_drop_percent']:.2f}%)**
-    - **Fuse protection: {cable_specs['fuse_rating']} A**
-    
-    *Standard cable sizes (IEC): 1.5, 2.5, 4, 6, 10, 16, 25, 35, 50, 70, 95, 120, 150, 185, 240 mm²*
-    """)
-
+    with st.expander(":material/info: " + tf.get("Cable.details", "Cable Details")):
+        st.markdown(f"""
+        **Calculation Details:**
+        - Current: {cable_specs['current']} A
+        - Cable length: {cable_length} m (one-way)
+        - Total circuit length: {cable_length * 2} m (round-trip)
+        - System voltage: {battery_voltage} V
+        - Maximum acceptable drop: {max_voltage_drop}% ({battery_voltage * max_voltage_drop/100:.2f} V)
+        - **Selected cable section: {cable_specs['cable_section']:.1f} mm²**
+        - **Actual voltage drop: {cable_specs['actual_drop_volts']:.2f} V ({cable_specs['actual_drop_percent']:.2f}%)**
+        - **Fuse protection: {cable_specs['fuse_rating']} A**
+
+        *Standard cable sizes (IEC): 1.5, 2.5, 4, 6, 10, 16, 25, 35, 50, 70, 95, 120, 150, 185, 240 mm²*
+        """)
+
+    st.session_state["cable_specs"] = cable_specs
+
+    # A fragment-only rerun (Apply on the cable form) skips the rest of
+    # the script, so refresh the stored results and redraw the summary
+    # box from here; otherwise the summary and the report would keep
+    # showing the previous cable figures.
+    results = st.session_state.get("calculation_results")
+    if results is not None and results.cable_specs != cable_specs:
+        st.session_state["calculation_results"] = replace(results, cable_specs=cable_specs)
+    slot = st.session_state.get("_summary_slot")
+    if slot is not None:
+        _render_summary(slot)
+
+
+# Full runs redraw the summary themselves below; clearing the slot keeps
+# the fragment from also writing into last run's stale placeholder.
+st.session_state["_summary_slot"] = None
+_cable_sizing_section(battery_voltage, recommended_current)
+cable_specs = st.session_state["cable_specs"]
 st.markdown("---")
 
 # Economic Analysis (expandable)
-with st.expander(":material/attach_money: " + t.get("Economics", {}).get("title", "Economic Analysis"), expanded=False):
-    st.subheader(t.get("Economics", {}).get("subtitle", "Cost Analysis & ROI"))
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        battery_unit_cost = st.number_input(
-            t.get("Economics", {}).get("battery_cost", "Battery Unit Cost ($)"),
-            min_value=0.0,
-            value=200.0,
-            step=10.0,
-            format="%.2f"
-        )
-        
-        pv_unit_cost = st.number_input(
-            t.get("Economics", {}).get("pv_cost", "Panel Unit Cost ($)"),
-            min_value=0.0,
-            value=150.0,
-            step=10.0,
-            format="%.2f"
+@st.fragment
+def _economics_section(num_batteries: int, num_panels: int, daily_energy: float) -> None:
+    """
+    Economic analysis expander, isolated in a fragment.
+
+    Edits to cost inputs rerun only this block instead of re-executing
+    the battery/PV/cable sections above it.
+    """
+    with st.expander(":material/attach_money: " + tf.get("Economics.title", "Economic Analysis"), expanded=False):
+        st.subheader(tf.get("Economics.subtitle", "Cost Analysis & ROI"))
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            battery_unit_cost = st.number_input(
+                tf.get("Economics.battery_cost", "Battery Unit Cost ($)"),
+                min_value=0.0,
+                value=200.0,
+                step=10.0,
+                format="%.2f"
+            )
+
+            pv_unit_cost = st.number_input(
+                tf.get("Economics.pv_cost", "Panel Unit Cost ($)"),
+                min_value=0.0,
+                value=150.0,
+                step=10.0,
+                format="%.2f"
+            )
+
+            converter_cost = st.number_input(
+                tf.get("Economics.converter_cost", "Converter Cost ($)"),
+                min_value=0.0,
+                value=300.0,
+                step=50.0,
+                format="%.2f"
+            )
+
+        with col2:
+            regulator_cost = st.number_input(
+                tf.get("Economics.regulator_cost", "Regulator Cost ($)"),
+                min_value=0.0,
+                value=200.0,
+                step=50.0,
+                format="%.2f"
+            )
+
+            installation_cost = st.number_input(
+                tf.get("Economics.installation_cost", "Installation Cost ($)"),
+                min_value=0.0,
+                value=500.0,
+                step=50.0,
+                format="%.2f"
+            )
+
+            electricity_price = st.number_input(
+                tf.get("Economics.electricity_price", "Electricity Price ($/kWh)"),
+                min_value=0.01,
+                value=0.15,
+                step=0.01,
+                format="%.2f"
+            )
+
+        # Imported lazily: only the economics expander needs these
+        from utils.calculations import (
+            calculate_system_cost, calculate_roi, calculate_co2_impact
         )
-        
-        converter_cost = st.number_input(
-            t.get("Economics", {}).get("converter_cost", "Converter Cost ($)"),
-            min_value=0.0,
-            value=300.0,
-            step=50.0,
-            format="%.2f"
+        _cached_system_cost = st.cache_data(max_entries=128)(calculate_system_cost)
+        _cached_roi = st.cache_data(max_entries=128)(calculate_roi)
+        _cached_co2_impact = st.cache_data(max_entries=128)(calculate_co2_impact)
+
+        # Calculate costs
+        costs = _cached_system_cost(
+            num_batteries=num_batteries,
+            battery_unit_cost=battery_unit_cost,
+            num_pv=num_panels,
+            pv_unit_cost=pv_unit_cost,
+            converter_cost=converter_cost,
+            regulator_cost=regulator_cost,
+            installation_cost=installation_cost
         )
-    
-    with col2:
-        regulator_cost = st.number_input(
-            t.get("Economics", {}).get("regulator_cost", "Regulator Cost ($)"),
-            min_value=0.0,
-            value=200.0,
-            step=50.0,
-            format="%.2f"
-        )
-        
-        installation_cost = st.number_input(
-            t.get("Economics", {}).get("installation_cost", "Installation Cost ($)"),
-            min_value=0.0,
-            value=500.0,
-            step=50.0,
-            format="%.2f"
-        )
-        
-        electricity_price = st.number_input(
-            t.get("Economics", {}).get("electricity_price", "Electricity Price ($/kWh)"),
-            min_value=0.01,
-            value=0.15,
-            step=0.01,
-            format="%.2f"
+
+        # Calculate ROI
+        roi_data = _cached_roi(
+            total_cost=costs["total"],
+            daily_energy_kwh=daily_energy / 1000,
+            electricity_price_per_kwh=electricity_price
         )
-    
-    # Calculate costs
-    costs = calculate_system_cost(
-        num_batteries=num_batteries,
-        battery_unit_cost=battery_unit_cost,
-        num_pv=num_panels,
-        pv_unit_cost=pv_unit_cost,
-        converter_cost=converter_cost,
-        regulator_cost=regulator_cost,
-        installation_cost=installation_cost
-    )
-    
-    # Calculate ROI
-    roi_data = calculate_roi(
-        total_cost=costs["total"],
-        daily_energy_kwh=daily_energy / 1000,
-        electricity_price_per_kwh=electricity_price
-    )
-    
-    # Calculate CO2 impact
-    co2_data = calculate_co2_impact(annual_energy_kwh=(daily_energy / 1000) * 365)
-    
-    st.markdown("### 💵 Cost Breakdown")
-    
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.metric(
-            t.get("Economics", {}).get("battery_total", "Batteries"),
+
+        # Calculate CO2 impact
+        co2_data = _cached_co2_impact(annual_energy_kwh=(daily_energy / 1000) * 365)
+
+        st.markdown("### 💵 Cost Breakdown")
+
+        col1, col2, col3 = st.columns(3)
+
+        col1.metric(
+            tf.get("Economics.battery_total", "Batteries"),
             f"${costs['battery_total']:.2f}"
         )
-        st.metric(
-            t.get("Economics", {}).get("pv_total", "Solar Panels"),
+        col1.metric(
+            tf.get("Economics.pv_total", "Solar Panels"),
             f"${costs['pv_total']:.2f}"
         )
-    
-    with col2:
-        st.metric(
-            t.get("Economics", {}).get("converter", "Converter"),
+        col2.metric(
+            tf.get("Economics.converter", "Converter"),
             f"${costs['converter']:.2f}"
         )
-        st.metric(
-            t.get("Economics", {}).get("regulator", "Regulator"),
+        col2.metric(
+            tf.get("Economics.regulator", "Regulator"),
             f"${costs['regulator']:.2f}"
         )
-    
-    with col3:
-        st.metric(
-            t.get("Economics", {}).get("installation", "Installation"),
+        col3.metric(
+            tf.get("Economics.installation", "Installation"),
             f"${costs['installation']:.2f}"
         )
-        st.metric(
-            t.get("Economics", {}).get("total", "**TOTAL**"),
+        col3.metric(
+            tf.get("Economics.total", "**TOTAL**"),
             f"**${costs['total']:.2f}**"
         )
-    
-    st.markdown("### :material/trending_up: Return on Investment")
-    
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.metric(
-            t.get("Economics", {}).get("daily_savings", "Daily Savings"),
+
+        st.markdown("### :material/trending_up: Return on Investment")
+
+        col1, col2, col3, col4 = st.columns(4)
+
+        col1.metric(
+            tf.get("Economics.daily_savings", "Daily Savings"),
             f"${roi_data['daily']:.2f}"
         )
-    
-    with col2:
-        st.metric(
-            t.get("Economics", {}).get("monthly_savings", "Monthly Savings"),
+        col2.metric(
+            tf.get("Economics.monthly_savings", "Monthly Savings"),
             f"${roi_data['monthly']:.2f}"
         )
-    
-    with col3:
-        st.metric(
-            t.get("Economics", {}).get("annual_savings", "Annual Savings"),
+        col3.metric(
+            tf.get("Economics.annual_savings", "Annual Savings"),
             f"${roi_data['annual']:.2f}"
         )
-    
-    with col4:
         roi_years = roi_data['roi_years']
         roi_color = "🟢" if roi_years < 10 else "🟡" if roi_years < 15 else "🔴"
-        st.metric(
-            t.get("Economics", {}).get("roi_years", "ROI Period"),
+        col4.metric(
+            tf.get("Economics.roi_years", "ROI Period"),
             f"{roi_color} {roi_years:.1f} years"
         )
-    
-    st.markdown("### :material/park: Environmental Impact")
-    
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.metric(
-            t.get("Economics", {}).get("co2_annual", "CO₂ Avoided/Year"),
+
+        st.markdown("### :material/park: Environmental Impact")
+
+        col1, col2, col3 = st.columns(3)
+
+        col1.metric(
+            tf.get("Economics.co2_annual", "CO₂ Avoided/Year"),
             f"{co2_data['co2_kg']:.0f} kg"
         )
-    
-    with col2:
-        st.metric(
-            t.get("Economics", {}).get("co2_lifetime", "CO₂ (25 years)"),
+        col2.metric(
+            tf.get("Economics.co2_lifetime", "CO₂ (25 years)"),
             f"{co2_data['co2_tons'] * 25:.1f} tons"
         )
-    
-    with col3:
-        st.metric(
-            t.get("Economics", {}).get("trees_equivalent", "Trees Equivalent"),
+        col3.metric(
+            tf.get("Economics.trees_equivalent", "Trees Equivalent"),
             f":material/park: {co2_data['trees']:.1f} trees/year"
         )
 
-# Summary Box
-st.markdown("---")
-st.subheader(":material/list: " + t.get("Summary", {}).get("title", "System Summary"))
 
-summary_col1, summary_col2, summary_col3 = st.columns(3)
+_economics_section(num_batteries, num_panels, daily_energy)
 
-with summary_col1:
-    st.markdown(f"""
-    **:material/bolt: Consumption**
-    - Daily: {daily_energy:.0f} Wh
-    - Total Power: {total_power:.0f} W
-    - Equipment: {len(factory.get_equipments())}
-    """)
 
-with summary_col2:
-    recommended_current_val = float(regulator_specs['recommended_current'])
-    st.markdown(f"""
-    **:material/battery_charging_full: System Components**
-    - Batteries: {num_batteries} × {battery_capacity}Ah {battery_voltage}V
-    - Solar Panels: {num_panels} × {pv_power}W
-    - Controller: {regulator_type} {math.ceil(recommended_current_val)}A
-    - Cable: {cable_specs['cable_section']:.1f}mm² (fuse: {cable_specs['fuse_rating']}A)
-    """)
+# Summary Box
+st.markdown("---")
+st.subheader(":material/list: " + tf.get("Summary.title", "System Summary"))
+
+# Derived figures the report re-displays; computed once here so the
+# report page only formats them.
+total_capacity = num_batteries * battery_capacity
+total_storage = total_capacity * battery_voltage
+daily_production = total_pv_power * sun_hours
+surplus = daily_production - daily_energy
+derived = {
+    "total_capacity": total_capacity,
+    "total_energy": total_storage,
+    "usable_energy": total_storage * discharge_depth,
+    "daily_production": daily_production,
+    "surplus": surplus,
+    "surplus_percent": (surplus / daily_energy * 100) if daily_energy > 0 else 0,
+    "panel_area": num_panels * 1.7,
+    "recommended_current": recommended_current,
+    "recommended_current_ceil": recommended_current_ceil,
+}
 
-with summary_col3:
-    st.markdown(f"""
-    **:material/check_circle: Recommendations**
-    - Battery Type: {battery_type}
-    - DoD: {discharge_depth*100:.0f}%
-    - Autonomy: {autonomy_days} days
-    - Max Voltage Drop: {max_voltage_drop}%
-    """)
+# Save calculation to session for report; only write back when something
+# actually changed so unchanged reruns skip Streamlit's state bookkeeping.
+# CalcResult's field-wise __eq__ keeps that guard working, and the report
+# reads the fields via slot attribute access instead of dict lookups.
+new_results = CalcResult(
+    daily_energy=daily_energy,
+    total_power=total_power,
+    num_batteries=num_batteries,
+    battery_voltage=battery_voltage,
+    battery_capacity=battery_capacity,
+    battery_type=battery_type,
+    discharge_depth=discharge_depth,
+    autonomy_days=autonomy_days,
+    num_panels=num_panels,
+    pv_power=pv_power,
+    total_pv_power=total_pv_power,
+    sun_hours=sun_hours,
+    regulator_type=regulator_type,
+    regulator_specs=regulator_specs,
+    cable_specs=cable_specs,
+    derived=derived,
+)
 
-# Save calculation to session for report
-if "calculation_results" not in st.session_state:
-    st.session_state["calculation_results"] = {}
-
-st.session_state["calculation_results"] = {
-    "daily_energy": daily_energy,
-    "total_power": total_power,
-    "num_batteries": num_batteries,
-    "battery_voltage": battery_voltage,
-    "battery_capacity": battery_capacity,
-    "battery_type": battery_type,
-    "discharge_depth": discharge_depth,
-    "autonomy_days": autonomy_days,
-    "num_panels": num_panels,
-    "pv_power": pv_power,
-    "total_pv_power": total_pv_power,
-    "sun_hours": sun_hours,
-    "regulator_type": regulator_type,
-    "regulator_specs": regulator_specs,
-    "cable_specs": cable_specs,
-}
+if st.session_state.get("calculation_results") != new_results:
+    st.session_state["calculation_results"] = new_results
+
+# Placeholder lets the cable fragment redraw this same box in place on
+# its own reruns, keeping the page self-consistent after Apply.
+st.session_state["_summary_slot"] = st.empty()
+_render_summary(st.session_state["_summary_slot"])
 
 # Action button
 st.markdown("---")
@@ -7,82 +7,44 @@ import json
 from pathlib import Path
 import sys
 from datetime import datetime
-import math
+
+import numpy as np
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from models.equipment import EquipmentFactory
 from utils.translations import load_translation
-from utils.charts import create_consumption_pie_chart, create_power_time_chart, create_hourly_profile_chart
+from utils.charts import create_consumption_pie_chart, create_power_time_chart, hourly_profile_df
 
-# Page configuration
-st.set_page_config(
-    page_title="Report - Solar Solution",
-    page_icon=":material/description:",
-    layout="wide"
-)
-
-# Initialize session state
-if "language" not in st.session_state:
-    st.session_state["language"] = load_translation("en")
-    st.session_state["current_lang"] = "en"
-
-if "equipments" not in st.session_state:
-    st.session_state["equipments"] = EquipmentFactory()
-
-t = st.session_state["language"]
-factory = st.session_state["equipments"]
-
-# Language selector in sidebar
-with st.sidebar:
-    st.markdown("### :material/settings: Settings")
-    lang = st.selectbox(
-        "🌍 Language", 
-        ["en", "fr"],
-        index=0 if st.session_state.get("current_lang", "en") == "en" else 1,
-        key="lang_selector_report"
-    )
-    
-    if lang != st.session_state.get("current_lang", "en"):
-        st.session_state["current_lang"] = lang
-        st.session_state["language"] = load_translation(lang)
-        st.rerun()
 
-# Top Navigation
-col1, col2, col3, col4 = st.columns(4)
-with col1:
-    if st.button(":material/home: " + t.get("nav_home", "Home"), width="stretch", key="nav_home_top"):
-        st.switch_page("app.py")
-with col2:
-    if st.button(":material/bolt: " + t.get("nav_equipments", "Equipments"), width="stretch", key="nav_eq_top"):
-        st.switch_page("pages/1_Equipments.py")
-with col3:
-    if st.button(":material/battery_charging_full: " + t.get("nav_calculations", "Calculations"), width="stretch", key="nav_calc_top"):
-        st.switch_page("pages/2_Calculations.py")
-with col4:
-    st.button(":material/description: " + t.get("nav_report", "Report"), width="stretch", disabled=True, type="primary", key="nav_report_top")
-
-st.markdown("---")
-
-# Check if equipment and calculations exist
-if factory.is_empty():
-    st.warning(":material/warning: " + t.get("Main", {}).get("no_equipment", "No equipment added. Please add equipment first."))
-    if st.button("➕ " + t.get("nav_equipments", "Go to Equipments"), key="warn_goto_eq"):
-        st.switch_page("pages/1_Equipments.py")
-    st.stop()
+# Static header/footer HTML, built once at import; each rerun only fills
+# in the timestamp instead of re-rendering the multi-line f-strings.
+_HEADER_TMPL = """
+<div class="report-header">
+    <h1>☀️ Solar System Design Report</h1>
+    <p style="font-size: 1.2rem; margin-top: 1rem;">
+        Generated on {now_str}
+    </p>
+</div>
+"""
 
-if "calculation_results" not in st.session_state or not st.session_state["calculation_results"]:
-    st.warning(":material/warning: No calculations found. Please configure your system first.")
-    if st.button(":material/battery_charging_full: " + t.get("nav_calculations", "Go to Calculations"), key="warn_goto_calc"):
-        st.switch_page("pages/2_Calculations.py")
-    st.stop()
+_FOOTER_TMPL = """
+---
+<div style="text-align: center; color: #666; padding: 2rem;">
+    <p><strong>Solar Solution</strong> - Professional Solar System Design Tool</p>
+    <p>Report generated on {now_str}</p>
+    <p style="font-size: 0.9rem;">
+        :material/warning: This report is for reference only. Please consult with a certified solar installer
+        for final system design and installation.
+    </p>
+</div>
+"""
 
-# Get calculation results
-calc = st.session_state["calculation_results"]
 
-# Print CSS
-st.markdown("""
+# Report CSS, a literal constant emitted once per run through st.html,
+# which skips the markdown parsing pass entirely.
+_REPORT_CSS = """
 <style>
 @media print {
     /* Hide Streamlit UI elements */
@@ -193,485 +155,647 @@ tr:hover {
     background-color: #f5f5f5;
 }
 </style>
-""", unsafe_allow_html=True)
-
-# Print button in sidebar
-with st.sidebar:
-    st.markdown("---")
-    st.markdown("### :material/print: Print Options")
-    st.info(":material/lightbulb: Use your browser's print function (Ctrl+P or Cmd+P) to print or save as PDF.")
-    if st.button(":material/print: Print Report", width="stretch", type="primary", key="print_report_btn"):
-        st.markdown("<script>window.print();</script>", unsafe_allow_html=True)
-
-# Report Header
-st.markdown(":material/wb_sunny:")
-st.markdown(f"""
-<div class="report-header">
-    <h1>☀️ Solar System Design Report</h1>
-    <p style="font-size: 1.2rem; margin-top: 1rem;">
-        Generated on {datetime.now().strftime('%B %d, %Y at %H:%M')}
-    </p>
-</div>
-""", unsafe_allow_html=True)
-
-# Project Information
-st.markdown('<div class="print-section">', unsafe_allow_html=True)
-st.markdown('<div class="report-section">', unsafe_allow_html=True)
-st.subheader(":material/list: Project Information")
-
-col1, col2, col3 = st.columns(3)
+"""
 
-with col1:
-    project_name = st.text_input("Project Name", value="My Solar System", key="project_name")
+_DIAGRAM_CSS = """
+<style>
+.diagram-box {
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    color: white;
+    padding: 1rem;
+    border-radius: 8px;
+    text-align: center;
+    margin: 0.5rem 0;
+    font-weight: bold;
+}
+.diagram-arrow {
+    text-align: center;
+    font-size: 2rem;
+    color: #667eea;
+    margin: 0.5rem 0;
+}
+.diagram-info {
+    text-align: center;
+    font-size: 0.9rem;
+    color: #666;
+    font-style: italic;
+}
+</style>
+"""
 
-with col2:
-    client_name = st.text_input("Client Name", value="", key="client_name")
+# Static column formatting for the equipment table, built once at import
+_EQUIPMENT_COLUMNS = {
+    "Power": st.column_config.NumberColumn("Power", format="%d W"),
+    "Usage Time": st.column_config.NumberColumn("Usage Time", format="%.1f h"),
+    "Energie": st.column_config.NumberColumn("Energie", format="%.0f Wh"),
+}
 
-with col3:
-    location = st.text_input("Location", value="", key="location")
 
-st.markdown('</div>', unsafe_allow_html=True)
-st.markdown('</div>', unsafe_allow_html=True)
+def _metric_box(value: str, unit: str, caption: str) -> str:
+    """Build one summary metric box as an HTML snippet."""
+    return (
+        '<div class="metric-box" style="flex:1">'
+        f'<div class="metric-value">{value}</div>'
+        f'<div class="metric-label">{unit}</div>'
+        f'<div style="font-size: 0.8rem; color: #888;">{caption}</div>'
+        '</div>'
+    )
 
-# Executive Summary
-st.markdown('<div class="print-section">', unsafe_allow_html=True)
-st.markdown('<div class="report-section">', unsafe_allow_html=True)
-st.subheader(":material/analytics: Executive Summary")
 
-col1, col2, col3, col4 = st.columns(4)
+def _metrics_row(items: list[tuple[str, str, str]]) -> str:
+    """
+    Build a row of labeled metric boxes as one HTML snippet.
+
+    The report's stats are display-only, so a single HTML payload
+    replaces three separate st.metric elements (one frontend delta
+    instead of three per row).
+    """
+    return (
+        '<div style="display:flex;gap:1rem">'
+        + ''.join(
+            '<div class="metric-box" style="flex:1">'
+            f'<div class="metric-label">{label}</div>'
+            f'<div class="metric-value" style="font-size:1.5rem">{value}</div>'
+            + (f'<div style="font-size: 0.8rem; color: #888;">{note}</div>' if note else '')
+            + '</div>'
+            for label, value, note in items
+        )
+        + '</div>'
+    )
 
-with col1:
-    st.markdown(f"""
-    <div class="metric-box">
-        <div class="metric-value">{calc['daily_energy']:.0f}</div>
-        <div class="metric-label">Wh/day</div>
-        <div style="font-size: 0.8rem; color: #888;">Daily Consumption</div>
-    </div>
-    """, unsafe_allow_html=True)
 
-with col2:
-    st.markdown(f"""
-    <div class="metric-box">
-        <div class="metric-value">{calc['num_batteries']}</div>
-        <div class="metric-label">Batteries</div>
-        <div style="font-size: 0.8rem; color: #888;">{calc['battery_capacity']}Ah {calc['battery_voltage']}V</div>
-    </div>
-    """, unsafe_allow_html=True)
+# Cached builders keyed on the equipment fingerprint (and language for
+# the chart labels): reruns triggered by the project text inputs reuse
+# the DataFrame and Plotly figures instead of rebuilding them. The
+# underscore-prefixed arguments are excluded from the cache key. Figures
+# are large mutable objects, hence cache_resource.
+@st.cache_data
+def _df_for(fp: int, _factory):
+    return _factory.df_datas()
+
+
+@st.cache_resource
+def _pie_chart_for(fp: int, lang: str, _factory, _t):
+    fig = create_consumption_pie_chart(_factory, _t)
+    fig.update_layout(height=300)
+    return fig
+
+
+@st.cache_resource
+def _power_time_chart_for(fp: int, lang: str, _factory, _t):
+    fig = create_power_time_chart(_factory, _t)
+    fig.update_layout(height=300)
+    return fig
+
+
+@st.cache_data
+def _hourly_df_for(fp: int, _factory):
+    return hourly_profile_df(_factory)
+
+
+@st.cache_data
+def _static_report_html(fp: int, _factory, calc, now_str: str) -> str:
+    """
+    Render the report as one self-contained static HTML document.
+
+    No Streamlit widgets and no Plotly runtime — just the report CSS,
+    the key figures, and the equipment table — so the download is a
+    single cached byte blob that any browser can print to PDF.
+    """
+    derived = calc.derived
+    regulator_specs = calc.regulator_specs
+    cable_specs = calc.cable_specs
+    equipment_table = _factory.df_datas().to_html(index=False, border=0)
+
+    boxes = [
+        (f"{calc.daily_energy:.0f}", "Wh/day", "Daily Consumption"),
+        (str(calc.num_batteries), "Batteries",
+         f"{calc.battery_capacity}Ah {calc.battery_voltage}V"),
+        (str(calc.num_panels), "Solar Panels", f"{calc.pv_power}W each"),
+        (str(calc.total_pv_power), "W", "Total PV Power"),
+    ]
+    summary_row = ''.join(_metric_box(*box) for box in boxes)
+
+    return f"""<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>Solar System Design Report</title>
+{_REPORT_CSS}
+</head>
+<body>
+{_HEADER_TMPL.format(now_str=now_str)}
+<div class="report-section">
+<h3>Executive Summary</h3>
+<div style="display:flex;gap:1rem">{summary_row}</div>
+</div>
+<div class="report-section">
+<h3>Equipment List</h3>
+{equipment_table}
+</div>
+<div class="report-section">
+<h3>Battery System</h3>
+<ul>
+<li>Battery Type: {calc.battery_type}</li>
+<li>Number of Batteries: {calc.num_batteries} × {calc.battery_capacity}Ah {calc.battery_voltage}V</li>
+<li>Depth of Discharge: {calc.discharge_depth*100:.0f}% — Autonomy: {calc.autonomy_days} days</li>
+<li>Total Energy Storage: {derived['total_energy']:.0f} Wh (usable {derived['usable_energy']:.0f} Wh)</li>
+</ul>
+</div>
+<div class="report-section">
+<h3>Solar Array</h3>
+<ul>
+<li>Panels: {calc.num_panels} × {calc.pv_power}W = {calc.total_pv_power}W</li>
+<li>Daily Production: {derived['daily_production']:.0f} Wh ({calc.sun_hours} peak sun hours)</li>
+<li>Surplus: {derived['surplus']:.0f} Wh ({derived['surplus_percent']:.1f}%)</li>
+<li>Estimated Panel Area: {derived['panel_area']:.1f} m²</li>
+</ul>
+</div>
+<div class="report-section">
+<h3>Controller, Cables and Protection</h3>
+<ul>
+<li>Controller: {calc.regulator_type}, rated for at least {derived['recommended_current_ceil']} A</li>
+<li>Cable Section: {cable_specs['cable_section']:.1f} mm²</li>
+<li>Voltage Drop: {cable_specs['actual_drop_volts']:.2f} V ({cable_specs['actual_drop_percent']:.2f}%)</li>
+<li>Fuse Rating: {cable_specs['fuse_rating']} A</li>
+</ul>
+</div>
+<p style="color:#666">Report generated on {now_str}. For reference only —
+consult a certified solar installer for final system design.</p>
+</body>
+</html>
+"""
 
-with col3:
-    st.markdown(f"""
-    <div class="metric-box">
-        <div class="metric-value">{calc['num_panels']}</div>
-        <div class="metric-label">Solar Panels</div>
-        <div style="font-size: 0.8rem; color: #888;">{calc['pv_power']}W each</div>
-    </div>
-    """, unsafe_allow_html=True)
 
-with col4:
-    st.markdown(f"""
-    <div class="metric-box">
-        <div class="metric-value">{calc['total_pv_power']}</div>
-        <div class="metric-label">W</div>
-        <div style="font-size: 0.8rem; color: #888;">Total PV Power</div>
-    </div>
-    """, unsafe_allow_html=True)
+# Page configuration
+st.set_page_config(
+    page_title="Report - Solar Solution",
+    page_icon=":material/description:",
+    layout="wide"
+)
 
-st.markdown('</div>', unsafe_allow_html=True)
-st.markdown('</div>', unsafe_allow_html=True)
+# Initialize session state
+if "language" not in st.session_state:
+    st.session_state["language"] = load_translation("en")
+    st.session_state["current_lang"] = "en"
 
-# Equipment List
-st.markdown('<div class="print-section">', unsafe_allow_html=True)
-st.markdown('<div class="report-section">', unsafe_allow_html=True)
-st.subheader(":material/bolt: Equipment List")
+if "equipments" not in st.session_state:
+    st.session_state["equipments"] = EquipmentFactory()
 
-df = factory.df_datas()
-st.dataframe(df, width="stretch", hide_index=True)
+t = st.session_state["language"]
+factory = st.session_state["equipments"]
 
-# Summary stats
-col1, col2, col3 = st.columns(3)
+# Language selector in sidebar
+with st.sidebar:
+    st.markdown("### :material/settings: Settings")
+    lang = st.selectbox(
+        "🌍 Language", 
+        ["en", "fr"],
+        index=0 if st.session_state.get("current_lang", "en") == "en" else 1,
+        key="lang_selector_report"
+    )
+    
+    if lang != st.session_state.get("current_lang", "en"):
+        st.session_state["current_lang"] = lang
+        st.session_state["language"] = load_translation(lang)
+        st.rerun()
 
+# Top Navigation
+col1, col2, col3, col4 = st.columns(4)
 with col1:
-    st.metric("Total Equipment", len(factory.get_equipments()))
-
+    if st.button(":material/home: " + t.get("nav_home", "Home"), width="stretch", key="nav_home_top"):
+        st.switch_page("app.py")
 with col2:
-    st.metric("Total Power", f"{calc['total_power']:.0f} W")
-
+    if st.button(":material/bolt: " + t.get("nav_equipments", "Equipments"), width="stretch", key="nav_eq_top"):
+        st.switch_page("pages/1_Equipments.py")
 with col3:
-    st.metric("Daily Energy", f"{calc['daily_energy']:.2f} Wh")
-
-st.markdown('</div>', unsafe_allow_html=True)
-st.markdown('</div>', unsafe_allow_html=True)
-
-# Consumption Charts
-st.markdown('<div class="print-section">', unsafe_allow_html=True)
-st.markdown('<div class="report-section">', unsafe_allow_html=True)
-st.subheader(":material/analytics: Consumption Analysis")
-
-col1, col2 = st.columns(2)
-
-with col1:
-    fig1 = create_consumption_pie_chart(factory, t)
-    fig1.update_layout(height=300)
-    st.plotly_chart(fig1, width="stretch")
-
-with col2:
-    fig2 = create_power_time_chart(factory, t)
-    fig2.update_layout(height=300)
-    st.plotly_chart(fig2, width="stretch")
-
-# Hourly profile
-fig3 = create_hourly_profile_chart(factory, t)
-fig3.update_layout(height=350)
-st.plotly_chart(fig3, width="stretch")
-
-hourly_profile = factory.get_hourly_profile()
-peak_consumption = max(hourly_profile)
-peak_hour = hourly_profile.index(peak_consumption)
-avg_consumption = sum(hourly_profile) / 24
-
-col1, col2, col3 = st.columns(3)
-
-with col1:
-    st.metric("Peak Consumption", f"{peak_consumption:.0f} W", f"@ {peak_hour}h")
-
-with col2:
-    st.metric("Average Consumption", f"{avg_consumption:.0f} W")
+    if st.button(":material/battery_charging_full: " + t.get("nav_calculations", "Calculations"), width="stretch", key="nav_calc_top"):
+        st.switch_page("pages/2_Calculations.py")
+with col4:
+    st.button(":material/description: " + t.get("nav_report", "Report"), width="stretch", disabled=True, type="primary", key="nav_report_top")
 
-with col3:
-    active_hours = sum(1 for p in hourly_profile if p > 0)
-    st.metric("Active Hours", f"{active_hours} h")
+st.markdown("---")
 
-st.markdown('</div>', unsafe_allow_html=True)
-st.markdown('</div>', unsafe_allow_html=True)
+# Check if equipment and calculations exist
+if factory.is_empty():
+    st.warning(":material/warning: " + t.get("Main", {}).get("no_equipment", "No equipment added. Please add equipment first."))
+    if st.button("➕ " + t.get("nav_equipments", "Go to Equipments"), key="warn_goto_eq"):
+        st.switch_page("pages/1_Equipments.py")
+    st.stop()
 
-# System Specifications
-st.markdown('<div class="print-section page-break">', unsafe_allow_html=True)
-st.markdown('<div class="report-section">', unsafe_allow_html=True)
-st.subheader(":material/battery_charging_full: Battery System Specifications")
+if "calculation_results" not in st.session_state or not st.session_state["calculation_results"]:
+    st.warning(":material/warning: No calculations found. Please configure your system first.")
+    if st.button(":material/battery_charging_full: " + t.get("nav_calculations", "Go to Calculations"), key="warn_goto_calc"):
+        st.switch_page("pages/2_Calculations.py")
+    st.stop()
 
-col1, col2 = st.columns(2)
+# Get calculation results
+calc = st.session_state["calculation_results"]
 
-with col1:
-    st.markdown(f"""
-    **Configuration:**
-    - Battery Type: {calc['battery_type']}
-    - Number of Batteries: **{calc['num_batteries']}**
-    - Battery Voltage: {calc['battery_voltage']} V
-    - Battery Capacity: {calc['battery_capacity']} Ah
-    - Depth of Discharge: {calc['discharge_depth']*100:.0f}%
-    - Autonomy: {calc['autonomy_days']} days
-    """)
+# Print CSS
+st.html(_REPORT_CSS)
 
-with col2:
-    total_capacity = calc['num_batteries'] * calc['battery_capacity']
-    total_energy = total_capacity * calc['battery_voltage']
-    usable_energy = total_energy * calc['discharge_depth']
-    
-    st.markdown(f"""
-    **Total Capacity:**
-    - Total Amp-Hours: {total_capacity} Ah
-    - Total Energy Storage: {total_energy:.0f} Wh ({total_energy/1000:.2f} kWh)
-    - Usable Energy: {usable_energy:.0f} Wh ({usable_energy/1000:.2f} kWh)
-    - Days of Autonomy: {calc['autonomy_days']} days
-    """)
+# Timestamp shared by the header, the footer, and the download
+now_str = datetime.now().strftime('%B %d, %Y at %H:%M')
 
-st.markdown('<div class="recommendation-box">', unsafe_allow_html=True)
-st.markdown(f"""
-**:material/lightbulb: Recommendation:** The battery bank provides {calc['autonomy_days']} days of autonomy at {calc['discharge_depth']*100:.0f}% depth of discharge. 
-For {calc['battery_type']} batteries, this DoD level ensures optimal lifespan and performance.
-""")
-st.markdown('</div>', unsafe_allow_html=True)
+# Print button in sidebar
+with st.sidebar:
+    st.markdown("---")
+    st.markdown("### :material/print: Print Options")
+    st.info(":material/lightbulb: Use your browser's print function (Ctrl+P or Cmd+P) to print or save as PDF.")
+    st.toggle("Expand all sections", key="expand_all",
+              help="Open every section, e.g. before printing")
+    if st.button(":material/print: Print Report", width="stretch", type="primary", key="print_report_btn"):
+        st.markdown("<script>window.print();</script>", unsafe_allow_html=True)
+    # Static export: one cached blob, no browser re-layout of the live
+    # page, printable to PDF from any browser
+    st.download_button(
+        ":material/download: Download HTML Report",
+        data=_static_report_html(factory.fingerprint(), factory, calc, now_str),
+        file_name="solar_report.html",
+        mime="text/html",
+        width="stretch",
+        key="download_report_btn"
+    )
 
-st.markdown('</div>', unsafe_allow_html=True)
-st.markdown('</div>', unsafe_allow_html=True)
+st.markdown(":material/wb_sunny:")
+st.markdown(_HEADER_TMPL.format(now_str=now_str), unsafe_allow_html=True)
 
-# Solar Panel System
-st.markdown('<div class="print-section">', unsafe_allow_html=True)
-st.markdown('<div class="report-section">', unsafe_allow_html=True)
-st.subheader(":material/wb_sunny: Solar Panel System Specifications")
+# Project Information
+st.markdown('<div class="print-section"><div class="report-section">', unsafe_allow_html=True)
+st.subheader(":material/list: Project Information")
 
-col1, col2 = st.columns(2)
+col1, col2, col3 = st.columns(3)
 
 with col1:
-    st.markdown(f"""
-    **Configuration:**
-    - Number of Panels: **{calc['num_panels']}**
-    - Panel Power: {calc['pv_power']} W
-    - Total PV Power: **{calc['total_pv_power']} W** ({calc['total_pv_power']/1000:.2f} kW)
-    - Peak Sun Hours: {calc['sun_hours']} h/day
-    """)
+    project_name = st.text_input("Project Name", value="My Solar System", key="project_name")
 
 with col2:
-    daily_production = calc['total_pv_power'] * calc['sun_hours']
-    surplus = daily_production - calc['daily_energy']
-    surplus_percent = (surplus / calc['daily_energy'] * 100) if calc['daily_energy'] > 0 else 0
-    panel_area = calc['num_panels'] * 1.7
-    
-    st.markdown(f"""
-    **Production:**
-    - Daily Production: {daily_production:.0f} Wh ({daily_production/1000:.2f} kWh)
-    - Daily Consumption: {calc['daily_energy']:.0f} Wh ({calc['daily_energy']/1000:.2f} kWh)
-    - Surplus: {surplus:.0f} Wh ({surplus_percent:.1f}%)
-    - Estimated Panel Area: {panel_area:.1f} m²
-    """)
-
-st.markdown('<div class="recommendation-box">', unsafe_allow_html=True)
-st.markdown(f"""
-**:material/lightbulb: Recommendation:** The solar array produces approximately {surplus_percent:.1f}% more energy than daily consumption, 
-providing a safety margin for cloudy days and ensuring the batteries are fully charged.
-""")
-st.markdown('</div>', unsafe_allow_html=True)
-
-st.markdown('</div>', unsafe_allow_html=True)
-st.markdown('</div>', unsafe_allow_html=True)
-
-# Charge Controller
-st.markdown('<div class="print-section">', unsafe_allow_html=True)
-st.markdown('<div class="report-section">', unsafe_allow_html=True)
-st.subheader(":material/settings: Charge Controller Specifications")
-
-regulator_specs = calc['regulator_specs']
+    client_name = st.text_input("Client Name", value="", key="client_name")
 
-col1, col2 = st.columns(2)
+with col3:
+    location = st.text_input("Location", value="", key="location")
 
-with col1:
-    st.markdown(f"""
-    **Controller Type:** {calc['regulator_type']}
-    - Nominal Current: {regulator_specs['nominal_current']:.1f} A
-    - **Recommended Current: {regulator_specs['recommended_current']:.1f} A**
-    - Efficiency: {regulator_specs['efficiency']*100:.0f}%
-    """)
+st.markdown('</div></div>', unsafe_allow_html=True)
+
+# Everything below the project inputs is a fragment: keystrokes in the
+# project/client/location text inputs rerun only the header section,
+# not the charts and report sections.
+@st.fragment
+def _render_report_body(calc, factory, t) -> None:
+    """Render the report sections below Project Information."""
+    # Collapsed sections defer frontend layout of the heavy content;
+    # the sidebar toggle opens everything for printing.
+    _expand_all = st.session_state.get("expand_all", False)
+
+    # Executive Summary
+    st.markdown('<div class="print-section"><div class="report-section">', unsafe_allow_html=True)
+    st.subheader(":material/analytics: Executive Summary")
+
+    boxes = [
+        (f"{calc.daily_energy:.0f}", "Wh/day", "Daily Consumption"),
+        (str(calc.num_batteries), "Batteries",
+         f"{calc.battery_capacity}Ah {calc.battery_voltage}V"),
+        (str(calc.num_panels), "Solar Panels", f"{calc.pv_power}W each"),
+        (str(calc.total_pv_power), "W", "Total PV Power"),
+    ]
+    st.markdown(
+        '<div style="display:flex;gap:1rem">'
+        + ''.join(_metric_box(*box) for box in boxes)
+        + '</div></div></div>',
+        unsafe_allow_html=True
+    )
 
-with col2:
-    st.markdown(f"""
-    **System Parameters:**
-    - PV Power: {regulator_specs['nominal_power']} W
-    - Battery Voltage: {calc['battery_voltage']} V
-    - Safety Margin: 25%
-    """)
+    # Equipment List
+    st.markdown('<div class="print-section"><div class="report-section">', unsafe_allow_html=True)
+    with st.expander(":material/bolt: Equipment List", expanded=_expand_all):
+
+        _fp = factory.fingerprint()
+        _lang = st.session_state.get("current_lang", "en")
+
+        df = _df_for(_fp, factory)
+        st.dataframe(df, width="stretch", hide_index=True,
+                     column_config=_EQUIPMENT_COLUMNS)
+
+        # Summary stats: one HTML row instead of three st.metric elements
+        st.html(_metrics_row([
+            ("Total Equipment", str(len(factory.get_equipments())), ""),
+            ("Total Power", f"{calc.total_power:.0f} W", ""),
+            ("Daily Energy", f"{calc.daily_energy:.2f} Wh", ""),
+        ]))
+
+    st.markdown('</div></div>', unsafe_allow_html=True)
+
+    # Consumption Charts
+    st.markdown('<div class="print-section"><div class="report-section">', unsafe_allow_html=True)
+    with st.expander(":material/analytics: Consumption Analysis", expanded=_expand_all):
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            fig1 = _pie_chart_for(_fp, _lang, factory, t)
+            st.plotly_chart(fig1, width="stretch")
+
+        with col2:
+            fig2 = _power_time_chart_for(_fp, _lang, factory, t)
+            st.plotly_chart(fig2, width="stretch")
+
+        # Hourly profile: the simple 24-point line is served by Streamlit's
+        # native line chart, which is far lighter than a Plotly figure. The
+        # interactive per-equipment Plotly version stays on the Equipments
+        # page.
+        st.line_chart(_hourly_df_for(_fp, factory), height=350)
+
+        # One vectorized pass over the profile instead of four Python-level
+        # scans (max, index, sum, active-hour count).
+        profile = np.asarray(factory.get_hourly_profile())
+        peak_hour = int(profile.argmax())
+        peak_consumption = float(profile[peak_hour])
+        avg_consumption = float(profile.mean())
+        active_hours = int((profile > 0).sum())
+
+        st.html(_metrics_row([
+            ("Peak Consumption", f"{peak_consumption:.0f} W", f"@ {peak_hour}h"),
+            ("Average Consumption", f"{avg_consumption:.0f} W", ""),
+            ("Active Hours", f"{active_hours} h", ""),
+        ]))
+
+    st.markdown('</div></div>', unsafe_allow_html=True)
+
+    # System Specifications
+    st.markdown('<div class="print-section page-break"><div class="report-section">', unsafe_allow_html=True)
+    st.subheader(":material/battery_charging_full: Battery System Specifications")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown(f"""
+        **Configuration:**
+        - Battery Type: {calc.battery_type}
+        - Number of Batteries: **{calc.num_batteries}**
+        - Battery Voltage: {calc.battery_voltage} V
+        - Battery Capacity: {calc.battery_capacity} Ah
+        - Depth of Discharge: {calc.discharge_depth*100:.0f}%
+        - Autonomy: {calc.autonomy_days} days
+        """)
+
+    with col2:
+        # Precomputed on the Calculations page alongside the results
+        derived = calc.derived
+        total_capacity = derived['total_capacity']
+        total_energy = derived['total_energy']
+        usable_energy = derived['usable_energy']
+
+        st.markdown(f"""
+        **Total Capacity:**
+        - Total Amp-Hours: {total_capacity} Ah
+        - Total Energy Storage: {total_energy:.0f} Wh ({total_energy/1000:.2f} kWh)
+        - Usable Energy: {usable_energy:.0f} Wh ({usable_energy/1000:.2f} kWh)
+        - Days of Autonomy: {calc.autonomy_days} days
+        """)
 
-st.markdown('<div class="recommendation-box">', unsafe_allow_html=True)
-recommended_current_val = float(regulator_specs['recommended_current'])
-if calc['regulator_type'] == "MPPT":
     st.markdown(f"""
-    **:material/lightbulb: Recommendation:** MPPT controller recommended for maximum efficiency (98%). 
-    Select a controller rated for at least {math.ceil(recommended_current_val)} A.
-    """)
-else:
-    st.markdown(f"""
-    **:material/lightbulb: Recommendation:** PWM controller is a cost-effective option (85% efficiency). 
-    Select a controller rated for at least {math.ceil(recommended_current_val)} A.
-    """)
-st.markdown('</div>', unsafe_allow_html=True)
-
-st.markdown('</div>', unsafe_allow_html=True)
-st.markdown('</div>', unsafe_allow_html=True)
-
-# Cable Specifications
-st.markdown('<div class="print-section">', unsafe_allow_html=True)
-st.markdown('<div class="report-section">', unsafe_allow_html=True)
-st.subheader(":material/power: Cable and Protection Specifications")
-
-cable_specs = calc['cable_specs']
+    <div class="recommendation-box">
+    <strong>💡 Recommendation:</strong> The battery bank provides {calc.autonomy_days} days of autonomy at {calc.discharge_depth*100:.0f}% depth of discharge.
+    For {calc.battery_type} batteries, this DoD level ensures optimal lifespan and performance.
+    </div>
+    </div></div>
+    """, unsafe_allow_html=True)
 
-col1, col2 = st.columns(2)
+    # Solar Panel System
+    st.markdown('<div class="print-section"><div class="report-section">', unsafe_allow_html=True)
+    st.subheader(":material/wb_sunny: Solar Panel System Specifications")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown(f"""
+        **Configuration:**
+        - Number of Panels: **{calc.num_panels}**
+        - Panel Power: {calc.pv_power} W
+        - Total PV Power: **{calc.total_pv_power} W** ({calc.total_pv_power/1000:.2f} kW)
+        - Peak Sun Hours: {calc.sun_hours} h/day
+        """)
+
+    with col2:
+        daily_production = derived['daily_production']
+        surplus = derived['surplus']
+        surplus_percent = derived['surplus_percent']
+        panel_area = derived['panel_area']
+
+        st.markdown(f"""
+        **Production:**
+        - Daily Production: {daily_production:.0f} Wh ({daily_production/1000:.2f} kWh)
+        - Daily Consumption: {calc.daily_energy:.0f} Wh ({calc.daily_energy/1000:.2f} kWh)
+        - Surplus: {surplus:.0f} Wh ({surplus_percent:.1f}%)
+        - Estimated Panel Area: {panel_area:.1f} m²
+        """)
 
-with col1:
     st.markdown(f"""
-    **Cable Specifications:**
-    - **Cable Section: {cable_specs['cable_section']:.1f} mm²**
-    - Maximum Current: {cable_specs['current']:.1f} A
-    - **Fuse Rating: {cable_specs['fuse_rating']} A**
-    """)
+    <div class="recommendation-box">
+    <strong>💡 Recommendation:</strong> The solar array produces approximately {surplus_percent:.1f}% more energy than daily consumption,
+    providing a safety margin for cloudy days and ensuring the batteries are fully charged.
+    </div>
+    </div></div>
+    """, unsafe_allow_html=True)
 
-with col2:
+    # Charge Controller
+    st.markdown('<div class="print-section"><div class="report-section">', unsafe_allow_html=True)
+    st.subheader(":material/settings: Charge Controller Specifications")
+
+    regulator_specs = calc.regulator_specs
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown(f"""
+        **Controller Type:** {calc.regulator_type}
+        - Nominal Current: {regulator_specs['nominal_current']:.1f} A
+        - **Recommended Current: {regulator_specs['recommended_current']:.1f} A**
+        - Efficiency: {regulator_specs['efficiency']*100:.0f}%
+        """)
+
+    with col2:
+        st.markdown(f"""
+        **System Parameters:**
+        - PV Power: {regulator_specs['nominal_power']} W
+        - Battery Voltage: {calc.battery_voltage} V
+        - Safety Margin: 25%
+        """)
+
+    if calc.regulator_type == "MPPT":
+        regulator_advice = "MPPT controller recommended for maximum efficiency (98%)."
+    else:
+        regulator_advice = "PWM controller is a cost-effective option (85% efficiency)."
     st.markdown(f"""
-    **Voltage Drop:**
-    - Actual Drop: {cable_specs['actual_drop_volts']:.2f} V ({cable_specs['actual_drop_percent']:.2f}%)
-    - System Voltage: {calc['battery_voltage']} V
-    - Within acceptable limits :material/check_circle:
-    """)
-
-st.markdown('<div class="warning-box">', unsafe_allow_html=True)
-st.markdown(f"""
-**:material/warning: Important:** Use cables with a section of at least {cable_specs['cable_section']:.1f} mm² to minimize voltage drop. 
-Install appropriate fuses ({cable_specs['fuse_rating']} A) for safety.
-""")
-st.markdown('</div>', unsafe_allow_html=True)
+    <div class="recommendation-box">
+    <strong>💡 Recommendation:</strong> {regulator_advice}
+    Select a controller rated for at least {derived['recommended_current_ceil']} A.
+    </div>
+    </div></div>
+    """, unsafe_allow_html=True)
 
-st.markdown('</div>', unsafe_allow_html=True)
-st.markdown('</div>', unsafe_allow_html=True)
+    # Cable Specifications
+    st.markdown('<div class="print-section"><div class="report-section">', unsafe_allow_html=True)
+    st.subheader(":material/power: Cable and Protection Specifications")
 
-# Installation Recommendations
-st.markdown('<div class="print-section page-break">', unsafe_allow_html=True)
-st.markdown('<div class="report-section">', unsafe_allow_html=True)
-st.subheader(":material/check_circle: Installation Recommendations")
+    cable_specs = calc.cable_specs
 
-col1, col2 = st.columns(2)
+    col1, col2 = st.columns(2)
 
-with col1:
-    st.markdown("""
-    **Solar Panel Installation:**
-    - Orient panels toward the equator (South in Northern Hemisphere, North in Southern)
-    - Tilt angle = latitude ± 15° (adjust seasonally for optimal performance)
-    - Ensure no shading from trees or buildings
-    - Allow proper ventilation to prevent overheating
-    - Use corrosion-resistant mounting hardware
-    - Ground the system properly
-    """)
+    with col1:
+        st.markdown(f"""
+        **Cable Specifications:**
+        - **Cable Section: {cable_specs['cable_section']:.1f} mm²**
+        - Maximum Current: {cable_specs['current']:.1f} A
+        - **Fuse Rating: {cable_specs['fuse_rating']} A**
+        """)
 
-with col2:
-    st.markdown("""
-    **Battery Installation:**
-    - Install in a well-ventilated area
-    - Keep away from direct sunlight and heat sources
-    - Ensure proper ventilation for gas release
-    - Use appropriate battery enclosure
-    - Connect batteries in series/parallel as needed
-    - Label all connections clearly
-    """)
+    with col2:
+        st.markdown(f"""
+        **Voltage Drop:**
+        - Actual Drop: {cable_specs['actual_drop_volts']:.2f} V ({cable_specs['actual_drop_percent']:.2f}%)
+        - System Voltage: {calc.battery_voltage} V
+        - Within acceptable limits :material/check_circle:
+        """)
 
-st.markdown("""
-**Electrical Safety:**
-- Install appropriate circuit breakers and fuses at all critical points
-- Use properly rated cables and connectors
-- Ensure all connections are tight and corrosion-free
-- Install a battery disconnect switch for maintenance
-- Label all components clearly
-- Follow local electrical codes and regulations
-- Consider hiring a certified electrician for installation
-
-**Maintenance:**
-- Check battery water levels monthly (for lead-acid batteries)
-- Clean solar panels quarterly
-- Inspect all connections semi-annually
-- Monitor system performance regularly
-- Keep records of maintenance activities
-""")
-
-st.markdown('</div>', unsafe_allow_html=True)
-st.markdown('</div>', unsafe_allow_html=True)
-
-# System Diagram
-st.markdown('<div class="print-section">', unsafe_allow_html=True)
-st.markdown('<div class="report-section">', unsafe_allow_html=True)
-st.subheader(":material/build: System Connection Diagram")
-
-recommended_current_diagram = float(regulator_specs['recommended_current'])
-
-# Create a more intuitive visual diagram using columns and boxes
-st.markdown("""
-<style>
-.diagram-box {
-    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-    color: white;
-    padding: 1rem;
-    border-radius: 8px;
-    text-align: center;
-    margin: 0.5rem 0;
-    font-weight: bold;
-}
-.diagram-arrow {
-    text-align: center;
-    font-size: 2rem;
-    color: #667eea;
-    margin: 0.5rem 0;
-}
-.diagram-info {
-    text-align: center;
-    font-size: 0.9rem;
-    color: #666;
-    font-style: italic;
-}
-</style>
-""", unsafe_allow_html=True)
-
-# Solar Panels
-st.markdown(f"""
-<div class="diagram-box">
-    ☀️ PANNEAUX SOLAIRES<br>
-    <span style="font-size: 1.2rem;">{calc['num_panels']} × {calc['pv_power']}W = {calc['total_pv_power']}W</span>
-</div>
-<div class="diagram-info">Production quotidienne: {calc['total_pv_power'] * calc['sun_hours']:.0f} Wh</div>
-<div class="diagram-arrow">↓</div>
-<div class="diagram-info">Câble: {cable_specs['cable_section']:.1f}mm² | Protection: Fusible {cable_specs['fuse_rating']}A</div>
-<div class="diagram-arrow">↓</div>
-""", unsafe_allow_html=True)
-
-# Charge Controller
-st.markdown(f"""
-<div class="diagram-box">
-    ⚙️ RÉGULATEUR DE CHARGE<br>
-    <span style="font-size: 1.2rem;">{calc['regulator_type']} - {math.ceil(recommended_current_diagram)}A</span>
-</div>
-<div class="diagram-info">Efficacité: {regulator_specs['efficiency']*100:.0f}%</div>
-<div class="diagram-arrow">↓</div>
-""", unsafe_allow_html=True)
-
-# Battery Bank and Inverter in columns
-col1, col2 = st.columns(2)
-
-with col1:
     st.markdown(f"""
-    <div class="diagram-box" style="background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);">
-        🔋 BANQUE DE BATTERIES<br>
-        <span style="font-size: 1.1rem;">{calc['num_batteries']} × {calc['battery_capacity']}Ah {calc['battery_voltage']}V</span><br>
-        <span style="font-size: 0.9rem;">Capacité totale: {calc['num_batteries'] * calc['battery_capacity']}Ah</span><br>
-        <span style="font-size: 0.9rem;">Énergie: {calc['num_batteries'] * calc['battery_capacity'] * calc['battery_voltage']:.0f}Wh</span>
+    <div class="warning-box">
+    <strong>⚠️ Important:</strong> Use cables with a section of at least {cable_specs['cable_section']:.1f} mm² to minimize voltage drop.
+    Install appropriate fuses ({cable_specs['fuse_rating']} A) for safety.
     </div>
-    <div class="diagram-info">Autonomie: {calc['autonomy_days']} jours | DoD: {calc['discharge_depth']*100:.0f}%</div>
+    </div></div>
     """, unsafe_allow_html=True)
 
-with col2:
-    st.markdown(f"""
-    <div class="diagram-box" style="background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%);">
-        🔄 ONDULEUR / CONVERTISSEUR<br>
-        <span style="font-size: 1.2rem;">{calc['total_power']}W minimum</span><br>
-        <span style="font-size: 0.9rem;">DC {calc['battery_voltage']}V → AC 230V</span>
-    </div>
-    <div class="diagram-info">Puissance de pointe: {calc['total_power'] * 1.5:.0f}W recommandé</div>
-    """, unsafe_allow_html=True)
+    # Installation Recommendations
+    st.markdown('<div class="print-section page-break"><div class="report-section">', unsafe_allow_html=True)
+    st.subheader(":material/check_circle: Installation Recommendations")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("""
+        **Solar Panel Installation:**
+        - Orient panels toward the equator (South in Northern Hemisphere, North in Southern)
+        - Tilt angle = latitude ± 15° (adjust seasonally for optimal performance)
+        - Ensure no shading from trees or buildings
+        - Allow proper ventilation to prevent overheating
+        - Use corrosion-resistant mounting hardware
+        - Ground the system properly
+        """)
+
+    with col2:
+        st.markdown("""
+        **Battery Installation:**
+        - Install in a well-ventilated area
+        - Keep away from direct sunlight and heat sources
+        - Ensure proper ventilation for gas release
+        - Use appropriate battery enclosure
+        - Connect batteries in series/parallel as needed
+        - Label all connections clearly
+        """)
 
-st.markdown('<div class="diagram-arrow">↓</div>', unsafe_allow_html=True)
+    st.markdown("""
+    **Electrical Safety:**
+    - Install appropriate circuit breakers and fuses at all critical points
+    - Use properly rated cables and connectors
+    - Ensure all connections are tight and corrosion-free
+    - Install a battery disconnect switch for maintenance
+    - Label all components clearly
+    - Follow local electrical codes and regulations
+    - Consider hiring a certified electrician for installation
+
+    **Maintenance:**
+    - Check battery water levels monthly (for lead-acid batteries)
+    - Clean solar panels quarterly
+    - Inspect all connections semi-annually
+    - Monitor system performance regularly
+    - Keep records of maintenance activities
+    """)
 
-# Loads
-st.markdown(f"""
-<div class="diagram-box" style="background: linear-gradient(135deg, #fa709a 0%, #fee140 100%);">
-    ⚡ CHARGES ÉLECTRIQUES<br>
-    <span style="font-size: 1.2rem;">Consommation: {calc['daily_energy']:.0f} Wh/jour</span><br>
-    <span style="font-size: 0.9rem;">Puissance totale: {calc['total_power']}W</span>
-</div>
-<div class="diagram-info">{len(factory.get_equipments())} équipements connectés</div>
-""", unsafe_allow_html=True)
+    st.markdown('</div></div>', unsafe_allow_html=True)
+
+    # System Diagram
+    st.markdown('<div class="print-section"><div class="report-section">', unsafe_allow_html=True)
+    with st.expander(":material/build: System Connection Diagram", expanded=_expand_all):
+
+        # Create a more intuitive visual diagram using columns and boxes
+        st.html(_DIAGRAM_CSS)
+
+        # Solar Panels and Charge Controller: one HTML block
+        st.markdown(f"""
+        <div class="diagram-box">
+            ☀️ PANNEAUX SOLAIRES<br>
+            <span style="font-size: 1.2rem;">{calc.num_panels} × {calc.pv_power}W = {calc.total_pv_power}W</span>
+        </div>
+        <div class="diagram-info">Production quotidienne: {derived['daily_production']:.0f} Wh</div>
+        <div class="diagram-arrow">↓</div>
+        <div class="diagram-info">Câble: {cable_specs['cable_section']:.1f}mm² | Protection: Fusible {cable_specs['fuse_rating']}A</div>
+        <div class="diagram-arrow">↓</div>
+        <div class="diagram-box">
+            ⚙️ RÉGULATEUR DE CHARGE<br>
+            <span style="font-size: 1.2rem;">{calc.regulator_type} - {derived['recommended_current_ceil']}A</span>
+        </div>
+        <div class="diagram-info">Efficacité: {regulator_specs['efficiency']*100:.0f}%</div>
+        <div class="diagram-arrow">↓</div>
+        """, unsafe_allow_html=True)
+
+        # Battery Bank and Inverter in columns
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.markdown(f"""
+            <div class="diagram-box" style="background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);">
+                🔋 BANQUE DE BATTERIES<br>
+                <span style="font-size: 1.1rem;">{calc.num_batteries} × {calc.battery_capacity}Ah {calc.battery_voltage}V</span><br>
+                <span style="font-size: 0.9rem;">Capacité totale: {derived['total_capacity']}Ah</span><br>
+                <span style="font-size: 0.9rem;">Énergie: {derived['total_energy']:.0f}Wh</span>
+            </div>
+            <div class="diagram-info">Autonomie: {calc.autonomy_days} jours | DoD: {calc.discharge_depth*100:.0f}%</div>
+            """, unsafe_allow_html=True)
+
+        with col2:
+            st.markdown(f"""
+            <div class="diagram-box" style="background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%);">
+                🔄 ONDULEUR / CONVERTISSEUR<br>
+                <span style="font-size: 1.2rem;">{calc.total_power}W minimum</span><br>
+                <span style="font-size: 0.9rem;">DC {calc.battery_voltage}V → AC 230V</span>
+            </div>
+            <div class="diagram-info">Puissance de pointe: {calc.total_power * 1.5:.0f}W recommandé</div>
+            """, unsafe_allow_html=True)
+
+        # Arrow and Loads: one HTML block
+        st.markdown(f"""
+        <div class="diagram-arrow">↓</div>
+        <div class="diagram-box" style="background: linear-gradient(135deg, #fa709a 0%, #fee140 100%);">
+            ⚡ CHARGES ÉLECTRIQUES<br>
+            <span style="font-size: 1.2rem;">Consommation: {calc.daily_energy:.0f} Wh/jour</span><br>
+            <span style="font-size: 0.9rem;">Puissance totale: {calc.total_power}W</span>
+        </div>
+        <div class="diagram-info">{len(factory.get_equipments())} équipements connectés</div>
+        """, unsafe_allow_html=True)
+
+        # Legend
+        st.markdown("---")
+        st.markdown("""
+        **📋 Légende du Flux d'Énergie:**
+        1. ☀️ **Panneaux Solaires** → Captent l'énergie solaire et la convertissent en électricité DC
+        2. ⚙️ **Régulateur** → Contrôle la charge des batteries et optimise le rendement
+        3. 🔋 **Batteries** → Stockent l'énergie pour utilisation durant la nuit ou jours nuageux
+        4. 🔄 **Onduleur** → Convertit le courant DC en AC 230V pour les appareils électriques
+        5. ⚡ **Charges** → Vos équipements électriques alimentés par le système
+        """)
+
+    st.markdown('</div></div>', unsafe_allow_html=True)
+
+    # Footer (same timestamp as the header)
+    st.markdown('<div class="print-section">', unsafe_allow_html=True)
+    st.markdown(_FOOTER_TMPL.format(now_str=now_str), unsafe_allow_html=True)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+
+_render_report_body(calc, factory, t)
 
-# Legend
-st.markdown("---")
-st.markdown("""
-**📋 Légende du Flux d'Énergie:**
-1. ☀️ **Panneaux Solaires** → Captent l'énergie solaire et la convertissent en électricité DC
-2. ⚙️ **Régulateur** → Contrôle la charge des batteries et optimise le rendement
-3. 🔋 **Batteries** → Stockent l'énergie pour utilisation durant la nuit ou jours nuageux
-4. 🔄 **Onduleur** → Convertit le courant DC en AC 230V pour les appareils électriques
-5. ⚡ **Charges** → Vos équipements électriques alimentés par le système
-""")
-
-st.markdown('</div>', unsafe_allow_html=True)
-st.markdown('</div>', unsafe_allow_html=True)
-
-# Footer
-st.markdown('<div class="print-section">', unsafe_allow_html=True)
-st.markdown("""
----
-<div style="text-align: center; color: #666; padding: 2rem;">
-    <p><strong>Solar Solution</strong> - Professional Solar System Design Tool</p>
-    <p>Report generated on {}</p>
-    <p style="font-size: 0.9rem;">
-        :material/warning: This report is for reference only. Please consult with a certified solar installer 
-        for final system design and installation.
-    </p>
-</div>
-""".format(datetime.now().strftime('%B %d, %Y at %H:%M')), unsafe_allow_html=True)
-st.markdown('</div>', unsafe_allow_html=True)
 
 # Action buttons (not printed)
 st.markdown("---")
@@ -2,6 +2,7 @@
 """Script pour remplacer tous les emojis par des icônes Material Design"""
 
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Mapping emoji → Material icon
@@ -47,25 +48,49 @@ EMOJI_MAPPING = {
     "✉️": ":material/email:",
 }
 
+# Les emojis mono-codepoint passent par str.translate (boucle C, pas de
+# callback Python par occurrence). Seuls ceux avec sélecteur de variante
+# (U+FE0F etc.) restent dans une alternation compilée, testée en premier
+# pour ne pas laisser translate consommer leur premier codepoint.
+# L'ensemble équivaut à un automate multi-motifs (type Aho-Corasick) :
+# chaque fichier est parcouru en un seul passage linéaire, quel que soit
+# le nombre d'emojis dans la table — inutile d'ajouter pyahocorasick
+# pour 36 motifs fixes sans préfixes communs.
+SINGLE_TABLE = {ord(e): icon for e, icon in EMOJI_MAPPING.items() if len(e) == 1}
+MULTI_PATTERN = re.compile(
+    "|".join(re.escape(e) for e in sorted(EMOJI_MAPPING, key=len, reverse=True)
+             if len(e) > 1)
+)
+
+# Détection rapide sur les octets bruts : les fichiers sans emoji (cas
+# courant au deuxième passage) ne sont jamais décodés
+_NEEDLE_PATTERN = re.compile(
+    b"|".join(re.escape(e.encode("utf-8")) for e in EMOJI_MAPPING)
+)
+
 def replace_emojis_in_file(file_path: Path) -> int:
     """Remplace tous les emojis dans un fichier"""
     try:
-        content = file_path.read_text(encoding='utf-8')
-        original_content = content
-        
-        # Remplacer chaque emoji
-        for emoji, icon in EMOJI_MAPPING.items():
-            content = content.replace(emoji, icon)
-        
-        # Compter les changements
-        changes = sum(1 for e in EMOJI_MAPPING if e in original_content)
-        
-        if content != original_content:
+        raw = file_path.read_bytes()
+        if _NEEDLE_PATTERN.search(raw) is None:
+            return 0
+        content = raw.decode('utf-8')
+
+        # Multi-codepoints d'abord (subn compte les occurrences), puis
+        # les mono-codepoints en un passage translate
+        content, changes = MULTI_PATTERN.subn(
+            lambda m: EMOJI_MAPPING[m.group(0)], content
+        )
+        translated = content.translate(SINGLE_TABLE)
+        if translated != content:
+            changes += sum(content.count(e) for e in EMOJI_MAPPING if len(e) == 1)
+            content = translated
+
+        if changes > 0:
             file_path.write_text(content, encoding='utf-8')
             print(f"✓ {file_path.name}: {changes} emojis remplacés")
-            return changes
-        return 0
-        
+        return changes
+
     except Exception as e:
         print(f"✗ {file_path.name}: Erreur - {e}")
         return 0
@@ -86,17 +111,22 @@ def main():
     
     total_changes = 0
     files_changed = 0
-    
+
     print("🔄 Remplacement des emojis par des icônes Material Design...\n")
-    
+
+    existing = []
     for file_path in files_to_process:
         if file_path.exists():
-            changes = replace_emojis_in_file(file_path)
+            existing.append(file_path)
+        else:
+            print(f"⚠ {file_path.name}: Fichier introuvable")
+
+    # Traitement I/O bound : lecture/écriture des fichiers en parallèle
+    with ThreadPoolExecutor() as executor:
+        for changes in executor.map(replace_emojis_in_file, existing):
             if changes > 0:
                 total_changes += changes
                 files_changed += 1
-        else:
-            print(f"⚠ {file_path.name}: Fichier introuvable")
     
     print(f"\n✅ Terminé: {total_changes} emojis remplacés dans {files_changed} fichiers")
 
@@ -0,0 +1,24 @@
+"""
+Shared pytest fixtures for the Solar Solution test suite.
+
+Centralizes the EquipmentFactory setup repeated across test modules so
+individual tests declare what they need instead of rebuilding it.
+"""
+
+import pytest
+from models import EquipmentFactory
+
+
+@pytest.fixture
+def factory():
+    """An empty EquipmentFactory."""
+    return EquipmentFactory()
+
+
+@pytest.fixture
+def loaded_factory():
+    """A factory preloaded with the Laptop/TV pair used across tests."""
+    loaded = EquipmentFactory()
+    loaded.add_equipment("Laptop", 65, 4.0)   # 260 Wh
+    loaded.add_equipment("TV", 150, 8.0)      # 1200 Wh
+    return loaded
@@ -13,11 +13,18 @@ import pytest
 from utils.calculations import (
     battery_needed,
     panel_needed,
+    battery_needed_vec,
+    panel_needed_vec,
     calculate_system_cost,
     calculate_roi,
     calculate_co2_impact,
+    calculate_system_cost_batch,
+    calculate_roi_batch,
+    calculate_co2_impact_batch,
     calculate_regulator,
-    calculate_cable_section
+    calculate_cable_section,
+    calculate_cable_section_batch,
+    size_system
 )
 
 
@@ -57,6 +64,19 @@ class TestBatteryCalculations:
         # Higher DoD means fewer or equal batteries needed
         assert num_80 <= num_50
 
+    def test_battery_needed_integer_inputs(self):
+        """All-integer inputs (full DoD) match the float path exactly"""
+        # 2400 Wh over 2 days, 12V 200Ah at DoD 1 -> ceil(4800/2400) = 2
+        assert battery_needed(2400, 12, 200, 2, 1) == 2
+        assert battery_needed(2400, 12, 200, 2, 1) == battery_needed(2400, 12, 200, 2, 1.0)
+
+    def test_battery_needed_vec_matches_scalar(self):
+        """Vectorized sweep agrees with the scalar function"""
+        energies = [500, 1000, 1200, 2500]
+        result = battery_needed_vec(energies, 12, 200, 2, 0.5)
+        expected = [battery_needed(e, 12, 200, 2, 0.5) for e in energies]
+        assert result.tolist() == expected
+
 
 class TestPanelCalculations:
     """Test cases for solar panel sizing"""
@@ -91,6 +111,13 @@ class TestPanelCalculations:
         # Panels needed = ceil(1500 / 500) = 3
         assert num == 3
 
+    def test_panel_needed_vec_matches_scalar(self):
+        """Vectorized sweep agrees with the scalar function"""
+        energies = [500, 1500, 3000, 4000]
+        result = panel_needed_vec(energies, 300, 5.0)
+        expected = [panel_needed(e, 300, 5.0) for e in energies]
+        assert result.tolist() == expected
+
 
 class TestSystemCostCalculations:
     """Test cases for system cost calculations"""
@@ -117,9 +144,18 @@ class TestSystemCostCalculations:
     def test_calculate_system_cost_zero_components(self):
         """Test with zero cost components"""
         costs = calculate_system_cost(0, 0.0, 0, 0.0, 0.0, 0.0, 0.0)
-        
+
         assert costs["total"] == 0.0
 
+    def test_calculate_system_cost_batch_matches_scalar(self):
+        """Batched cost sweep agrees with the scalar function"""
+        counts = [2, 4, 8]
+        batch = calculate_system_cost_batch(counts, 200.0, 6, 150.0, 300.0, 200.0, 500.0)
+        for i, n in enumerate(counts):
+            scalar = calculate_system_cost(n, 200.0, 6, 150.0, 300.0, 200.0, 500.0)
+            assert batch["battery_total"][i] == scalar["battery_total"]
+            assert batch["total"][i] == scalar["total"]
+
 
 class TestROICalculations:
     """Test cases for ROI and savings calculations"""
@@ -157,6 +193,13 @@ class TestROICalculations:
         assert roi["annual"] == 0.0
         assert roi["roi_years"] == float('inf')
 
+    def test_calculate_roi_batch_inf_on_zero_savings(self):
+        """Batched ROI matches the scalar values and inf handling"""
+        batch = calculate_roi_batch(5000.0, [10.0, 0.0], 0.15)
+
+        assert pytest.approx(batch["roi_years"][0], 0.01) == 9.13
+        assert batch["roi_years"][1] == float('inf')
+
 
 class TestCO2ImpactCalculations:
     """Test cases for CO2 impact calculations"""
@@ -189,6 +232,15 @@ class TestCO2ImpactCalculations:
         assert impact["co2_tons"] == 0.0
         assert impact["trees"] == 0.0
 
+    def test_calculate_co2_impact_batch_matches_scalar(self):
+        """Batched CO2 sweep agrees with the scalar function"""
+        energies = [365.0, 3650.0]
+        batch = calculate_co2_impact_batch(energies)
+        for i, e in enumerate(energies):
+            scalar = calculate_co2_impact(e)
+            assert batch["co2_kg"][i] == scalar["co2_kg"]
+            assert batch["trees"][i] == scalar["trees"]
+
 
 class TestRegulatorCalculations:
     """Test cases for charge controller specifications"""
@@ -230,6 +282,11 @@ class TestRegulatorCalculations:
         
         assert mppt["efficiency"] > pwm["efficiency"]
 
+    def test_calculate_regulator_unknown_type_rejected(self):
+        """Test that a typo'd regulator type raises instead of defaulting"""
+        with pytest.raises(KeyError):
+            calculate_regulator(600.0, 12, "MPTT")
+
 
 class TestCableSectionCalculations:
     """Test cases for cable sizing calculations"""
@@ -280,6 +337,15 @@ class TestCableSectionCalculations:
         
         # Even with low current, fuse should be at least 5A
         assert spec["fuse_rating"] >= 5
+
+    def test_calculate_cable_section_fuse_rounding(self):
+        """Test fuse rounding to the nearest 5A step"""
+        # 2 A: 2 * 1.25 = 2.5 A rounds up to the 5 A minimum
+        assert calculate_cable_section(2.0, 5.0, 12, 3.0)["fuse_rating"] == 5
+        # 40 A: 40 * 1.25 = 50 A lands exactly on a step
+        assert calculate_cable_section(40.0, 10.0, 24, 3.0)["fuse_rating"] == 50
+        # 10 A: 10 * 1.25 = 12.5 A rounds half up to 15 A
+        assert calculate_cable_section(10.0, 5.0, 12, 3.0)["fuse_rating"] == 15
     
     def test_calculate_cable_section_tight_drop_requirement(self):
         """Test with tight voltage drop requirement"""
@@ -288,3 +354,44 @@ class TestCableSectionCalculations:
         
         # Tighter requirement needs larger cable
         assert tight["cable_section"] > loose["cable_section"]
+
+    def test_calculate_cable_section_batch_matches_scalar(self):
+        """Batched circuit sizing agrees with the scalar function"""
+        currents = [2.0, 10.0, 40.0, 50.0]
+        batch = calculate_cable_section_batch(currents, 10.0, 12, 3.0)
+        for i, amps in enumerate(currents):
+            scalar = calculate_cable_section(amps, 10.0, 12, 3.0)
+            assert batch["cable_section"][i] == scalar["cable_section"]
+            assert batch["actual_drop_volts"][i] == pytest.approx(scalar["actual_drop_volts"])
+            assert batch["fuse_rating"][i] == scalar["fuse_rating"]
+
+
+class TestSystemSizing:
+    """Test cases for the fused sizing + costing call"""
+
+    def test_size_system_matches_composed_calls(self):
+        """Fused result agrees with the individual functions"""
+        sizing = size_system(
+            daily_energy_wh=1000.0,
+            battery_voltage=12,
+            battery_capacity_ah=200,
+            autonomy_days=2,
+            discharge_depth=0.5,
+            pv_power_w=300,
+            sun_hours=5.0,
+            battery_unit_cost=200.0,
+            pv_unit_cost=150.0,
+            converter_cost=300.0,
+            regulator_cost=200.0,
+            installation_cost=500.0
+        )
+
+        num_batteries = battery_needed(1000.0, 12, 200, 2, 0.5)
+        num_panels = panel_needed(1000.0, 300, 5.0)
+        costs = calculate_system_cost(
+            num_batteries, 200.0, num_panels, 150.0, 300.0, 200.0, 500.0
+        )
+
+        assert sizing["num_batteries"] == num_batteries
+        assert sizing["num_panels"] == num_panels
+        assert sizing["total"] == costs["total"]
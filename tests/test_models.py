@@ -94,140 +94,122 @@ class TestEquipment:
 
 class TestEquipmentFactory:
     """Test cases for the EquipmentFactory class"""
-    
-    def test_factory_creation(self):
+
+    def test_factory_creation(self, factory):
         """Test factory initialization"""
-        factory = EquipmentFactory()
         assert factory.is_empty()
         assert len(factory.get_equipments()) == 0
-    
-    def test_add_equipment(self):
+
+    def test_add_equipment(self, factory):
         """Test adding equipment to factory"""
-        factory = EquipmentFactory()
         factory.add_equipment("Laptop", 65, 4.0)
-        
+
         assert not factory.is_empty()
         assert len(factory.get_equipments()) == 1
-        
+
         eq = factory.get_equipments()[0]
         assert eq.name == "Laptop"
         assert eq.power == 65
-    
-    def test_add_duplicate_equipment_raises_error(self):
+
+    def test_add_duplicate_equipment_raises_error(self, factory):
         """Test that adding duplicate equipment raises ValueError"""
-        factory = EquipmentFactory()
         factory.add_equipment("Laptop", 65, 4.0)
-        
+
         with pytest.raises(ValueError):
             factory.add_equipment("Laptop", 100, 8.0)
-    
-    def test_total_energy_consumption(self):
+
+    def test_total_energy_consumption(self, loaded_factory):
         """Test total energy consumption calculation"""
-        factory = EquipmentFactory()
-        factory.add_equipment("Laptop", 65, 4.0)  # 260 Wh
-        factory.add_equipment("TV", 150, 8.0)     # 1200 Wh
-        
-        total = factory.total_energy_consumption()
+        total = loaded_factory.total_energy_consumption()
         assert total == 1460.0  # 260 + 1200
-    
-    def test_total_power(self):
+
+    def test_total_power(self, loaded_factory):
         """Test total power calculation"""
-        factory = EquipmentFactory()
-        factory.add_equipment("Laptop", 65, 4.0)
-        factory.add_equipment("TV", 150, 8.0)
-        
-        total = factory.total_power()
+        total = loaded_factory.total_power()
         assert total == 215.0  # 65 + 150
-    
-    def test_get_hourly_profile(self):
+
+    def test_get_hourly_profile(self, factory):
         """Test aggregated hourly consumption profile"""
-        factory = EquipmentFactory()
         factory.add_equipment("Heater", 1000, 2.0, start_hour=6)  # 6-8
         factory.add_equipment("Light", 100, 5.0, start_hour=18)   # 18-23
-        
+
         profile = factory.get_hourly_profile()
-        
+
         assert len(profile) == 24
         assert profile[6] == 1000   # Only heater
         assert profile[7] == 1000   # Only heater
         assert profile[18] == 100   # Only light
         assert profile[22] == 100   # Only light
         assert profile[12] == 0     # Nothing
-    
-    def test_delete_equipment(self):
+
+    def test_delete_equipment(self, loaded_factory):
         """Test deleting equipment"""
-        factory = EquipmentFactory()
-        factory.add_equipment("Laptop", 65, 4.0)
-        factory.add_equipment("TV", 150, 8.0)
-        
-        eq = factory.get_equipments()[0]
-        factory.delete_equipment(eq)
-        
-        assert len(factory.get_equipments()) == 1
-        assert factory.get_equipments()[0].name == "TV"
-    
-    def test_delete_all_equipments(self):
+        eq = loaded_factory.get_equipments()[0]
+        loaded_factory.delete_equipment(eq)
+
+        assert len(loaded_factory.get_equipments()) == 1
+        assert loaded_factory.get_equipments()[0].name == "TV"
+
+    def test_delete_all_equipments(self, loaded_factory):
         """Test deleting all equipment"""
-        factory = EquipmentFactory()
-        factory.add_equipment("Laptop", 65, 4.0)
-        factory.add_equipment("TV", 150, 8.0)
-        
-        factory.delete_all_equipments()
-        
-        assert factory.is_empty()
-        assert len(factory.get_equipments()) == 0
-    
-    def test_edit_equipment(self):
+        loaded_factory.delete_all_equipments()
+
+        assert loaded_factory.is_empty()
+        assert len(loaded_factory.get_equipments()) == 0
+
+    def test_edit_equipment(self, factory):
         """Test editing existing equipment"""
-        factory = EquipmentFactory()
         factory.add_equipment("Laptop", 65, 4.0, start_hour=9)
-        
+
         old_eq = factory.get_equipments()[0]
         factory.edit_equipment(old_eq, "Gaming Laptop", 150, 6.0, 14)
-        
+
         eq = factory.get_equipments()[0]
         assert eq.name == "Gaming Laptop"
         assert eq.power == 150
         assert eq.time == 6.0
         assert eq.start_hour == 14
-    
-    def test_edit_nonexistent_equipment_raises_error(self):
+
+    def test_edit_nonexistent_equipment_raises_error(self, factory):
         """Test editing non-existent equipment raises ValueError"""
-        factory = EquipmentFactory()
         factory.add_equipment("Laptop", 65, 4.0)
-        
+
         fake_eq = Equipment("Fake", 100, 2.0)
-        
+
         with pytest.raises(ValueError):
             factory.edit_equipment(fake_eq, "New Name", 200, 4.0)
-    
-    def test_get_equipment_by_name(self):
+
+    def test_get_equipment_by_name(self, loaded_factory):
         """Test getting equipment by name"""
-        factory = EquipmentFactory()
-        factory.add_equipment("Laptop", 65, 4.0)
-        factory.add_equipment("TV", 150, 8.0)
-        
-        eq = factory.get_equipment_by_name("Laptop")
+        eq = loaded_factory.get_equipment_by_name("Laptop")
         assert eq is not None
         assert eq.name == "Laptop"
         assert eq.power == 65
-    
-    def test_get_equipment_by_name_not_found(self):
+
+    def test_get_equipment_by_name_not_found(self, factory):
         """Test getting non-existent equipment returns None"""
-        factory = EquipmentFactory()
         factory.add_equipment("Laptop", 65, 4.0)
-        
+
         eq = factory.get_equipment_by_name("Desktop")
         assert eq is None
-    
-    def test_df_datas(self):
+
+    def test_fingerprint_changes_with_equipment_list(self, factory):
+        """Test fingerprint is stable until the equipment list changes"""
+        factory.add_equipment("Laptop", 65, 4.0)
+
+        fp = factory.fingerprint()
+        assert factory.fingerprint() == fp
+
+        factory.add_equipment("TV", 150, 8.0)
+        assert factory.fingerprint() != fp
+
+    def test_df_datas(self, factory):
         """Test DataFrame generation"""
-        factory = EquipmentFactory()
         factory.add_equipment("Laptop", 65, 4.0, start_hour=9)
         factory.add_equipment("TV", 150, 8.0, start_hour=18)
-        
+
         df = factory.df_datas()
-        
+
         assert len(df) == 2
         assert list(df.columns) == ["Name", "Power", "Usage Time", "Schedule", "Energie"]
         assert df.iloc[0]["Name"] == "Laptop"
@@ -11,13 +11,25 @@ This package contains utility functions for:
 from .calculations import (
     battery_needed,
     panel_needed,
+    battery_needed_vec,
+    panel_needed_vec,
     calculate_system_cost,
     calculate_roi,
     calculate_co2_impact,
+    calculate_system_cost_batch,
+    calculate_roi_batch,
+    calculate_co2_impact_batch,
     calculate_regulator,
-    calculate_cable_section
+    calculate_cable_section,
+    calculate_cable_section_batch,
+    size_system,
+    CostBreakdown,
+    ROIResult,
+    CO2Result,
+    RegulatorSpec,
+    CableSpec
 )
-from .translations import load_translation, get_available_languages
+from .translations import load_translation, flatten_translation, get_available_languages
 from .storage import (
     save_configuration,
     load_configuration,
@@ -29,20 +41,36 @@ from .storage import (
 from .charts import (
     create_consumption_pie_chart,
     create_power_time_chart,
-    create_hourly_profile_chart
+    create_hourly_profile_chart,
+    hourly_profile_df,
+    prepare_chart_data,
+    ChartData
 )
 
 __all__ = [
     # Calculations
     "battery_needed",
     "panel_needed",
+    "battery_needed_vec",
+    "panel_needed_vec",
     "calculate_system_cost",
     "calculate_roi",
     "calculate_co2_impact",
+    "calculate_system_cost_batch",
+    "calculate_roi_batch",
+    "calculate_co2_impact_batch",
     "calculate_regulator",
     "calculate_cable_section",
+    "calculate_cable_section_batch",
+    "size_system",
+    "CostBreakdown",
+    "ROIResult",
+    "CO2Result",
+    "RegulatorSpec",
+    "CableSpec",
     # Translations
     "load_translation",
+    "flatten_translation",
     "get_available_languages",
     # Storage
     "save_configuration",
@@ -54,5 +82,8 @@ __all__ = [
     # Charts
     "create_consumption_pie_chart",
     "create_power_time_chart",
-    "create_hourly_profile_chart"
+    "create_hourly_profile_chart",
+    "hourly_profile_df",
+    "prepare_chart_data",
+    "ChartData"
 ]
@@ -7,11 +7,100 @@ This module contains all calculation functions for:
 - Regulator and wiring specifications
 """
 
-from typing import Dict, Union
+import bisect
+from collections import namedtuple
+from functools import lru_cache
+from math import ceil
+from typing import Dict
 
+import numpy as np
 
+# Standard cable sections (mm²) according to IEC standards, sorted so the
+# next suitable section can be picked with a binary search. The plain
+# tuple serves the scalar path (bisect avoids NumPy's scalar-call
+# overhead); the ndarray mirror is for vectorized batch sizing.
+_STANDARD_SECTIONS = (
+    1.5, 2.5, 4.0, 6.0, 10.0, 16.0, 25.0, 35.0, 50.0,
+    70.0, 95.0, 120.0, 150.0, 185.0, 240.0
+)
+_IEC_SECTIONS = np.array(_STANDARD_SECTIONS, dtype=np.float64)
+
+# CO2 impact constants: average grid emissions per kWh (varies by country
+# and energy mix) and the yearly absorption of one tree. Divisions are
+# folded into reciprocal multiplications, which also vectorize better in
+# the batched variant.
+_KG_CO2_PER_KWH = 0.5
+_KG_TO_TON = 1e-3
+_INV_TREE_KG = 1.0 / 21.0
+
+# Controller efficiencies by type. A dict lookup instead of a string
+# compare also rejects typos with a KeyError instead of silently
+# treating them as PWM.
+_REGULATOR_EFF = {"MPPT": 0.98, "PWM": 0.85}
+
+
+class _ResultTuple:
+    """
+    Mixin granting dict-style result["key"] access on result tuples.
+
+    The calculation functions historically returned dicts; their results
+    are now namedtuples (cheaper to allocate, attribute access instead
+    of hashing), and this mixin keeps every existing ["key"] call site
+    working unchanged.
+    """
+
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return getattr(self, key)
+        return super().__getitem__(key)
+
+
+class CostBreakdown(_ResultTuple, namedtuple(
+        "CostBreakdown", "battery_total pv_total converter regulator installation total")):
+    """System cost breakdown returned by calculate_system_cost."""
+    __slots__ = ()
+
+
+class ROIResult(_ResultTuple, namedtuple(
+        "ROIResult", "daily monthly annual roi_years")):
+    """Savings and payback period returned by calculate_roi."""
+    __slots__ = ()
+
+
+class CO2Result(_ResultTuple, namedtuple(
+        "CO2Result", "co2_kg co2_tons trees")):
+    """Avoided emissions returned by calculate_co2_impact."""
+    __slots__ = ()
+
+
+class RegulatorSpec(_ResultTuple, namedtuple(
+        "RegulatorSpec", "nominal_current recommended_current nominal_power efficiency type")):
+    """Charge controller sizing returned by calculate_regulator."""
+    __slots__ = ()
+
+
+class CableSpec(_ResultTuple, namedtuple(
+        "CableSpec", "cable_section actual_drop_volts actual_drop_percent fuse_rating current")):
+    """Cable and protection sizing returned by calculate_cable_section."""
+    __slots__ = ()
+
+
+class SystemSizing(_ResultTuple, namedtuple(
+        "SystemSizing",
+        "num_batteries num_panels battery_total pv_total converter regulator installation total")):
+    """Combined sizing and cost result returned by size_system."""
+    __slots__ = ()
+
+
+# Memoized: the UI re-invokes sizing with the same few voltages,
+# capacities and panel wattages as users toggle unrelated widgets, so
+# repeat queries collapse to a dict lookup. Results are immutable
+# (ints / namedtuples), so sharing cached values is safe.
+@lru_cache(maxsize=256)
 def battery_needed(
-    daily_energy_wh: float, 
+    daily_energy_wh: float,
     battery_voltage: int, 
     battery_capacity_ah: int, 
     autonomy_days: int, 
@@ -32,12 +121,27 @@ def battery_needed(
     Returns:
         int: Number of batteries needed (rounded up)
     """
-    import math
+    # All-integer inputs (DoD of 1 included) take the exact ceiling-
+    # division path: no float division, so boundary cases like an exact
+    # capacity match can't be nudged by rounding noise.
+    if (
+        isinstance(daily_energy_wh, int)
+        and isinstance(battery_voltage, int)
+        and isinstance(battery_capacity_ah, int)
+        and isinstance(autonomy_days, int)
+        and isinstance(discharge_depth, int)
+    ):
+        return -(
+            -(daily_energy_wh * autonomy_days)
+            // (battery_voltage * battery_capacity_ah * discharge_depth)
+        )
+
     energy_needed = daily_energy_wh * autonomy_days
     battery_energy = battery_voltage * battery_capacity_ah * discharge_depth
-    return math.ceil(energy_needed / battery_energy)
+    return ceil(energy_needed / battery_energy)
 
 
+@lru_cache(maxsize=256)
 def panel_needed(
     daily_energy_wh: float,
     pv_power_w: int,
@@ -45,19 +149,76 @@ def panel_needed(
 ) -> int:
     """
     Calculate the number of solar panels needed.
-    
+
     Formula: n = E / (P × H)
-    
+
     Args:
         daily_energy_wh: Daily energy consumption in Watt-hours
         pv_power_w: Power of one solar panel in Watts
         sun_hours: Peak sun hours per day
-        
+
     Returns:
         int: Number of panels needed (rounded up)
     """
-    import math
-    return math.ceil(daily_energy_wh / (pv_power_w * sun_hours))
+    return ceil(daily_energy_wh / (pv_power_w * sun_hours))
+
+
+def battery_needed_vec(
+    daily_energy_wh,
+    battery_voltage,
+    battery_capacity_ah,
+    autonomy_days,
+    discharge_depth
+) -> np.ndarray:
+    """
+    Vectorized battery sizing over arrays of configurations.
+
+    Applies the same formula as battery_needed to whole parameter
+    sweeps in one NumPy pass; any argument may be a scalar or an
+    array-like, broadcast against the others.
+
+    Args:
+        daily_energy_wh: Daily energy consumption(s) in Watt-hours
+        battery_voltage: Battery voltage(s) in Volts
+        battery_capacity_ah: Battery capacity(ies) in Amp-hours
+        autonomy_days: Days of autonomy
+        discharge_depth: Depth(s) of discharge (0-1)
+
+    Returns:
+        np.ndarray: Number of batteries needed per configuration (int64)
+    """
+    energy_needed = np.asarray(daily_energy_wh, dtype=np.float64) * np.asarray(autonomy_days)
+    battery_energy = (
+        np.asarray(battery_voltage, dtype=np.float64)
+        * np.asarray(battery_capacity_ah)
+        * np.asarray(discharge_depth)
+    )
+    return np.ceil(energy_needed / battery_energy).astype(np.int64)
+
+
+def panel_needed_vec(
+    daily_energy_wh,
+    pv_power_w,
+    sun_hours
+) -> np.ndarray:
+    """
+    Vectorized panel sizing over arrays of configurations.
+
+    Applies the same formula as panel_needed to whole parameter sweeps
+    in one NumPy pass; any argument may be a scalar or an array-like,
+    broadcast against the others.
+
+    Args:
+        daily_energy_wh: Daily energy consumption(s) in Watt-hours
+        pv_power_w: Power(s) of one solar panel in Watts
+        sun_hours: Peak sun hours per day
+
+    Returns:
+        np.ndarray: Number of panels needed per configuration (int64)
+    """
+    daily = np.asarray(daily_energy_wh, dtype=np.float64)
+    production = np.asarray(pv_power_w, dtype=np.float64) * np.asarray(sun_hours)
+    return np.ceil(daily / production).astype(np.int64)
 
 
 def calculate_system_cost(
@@ -68,10 +229,10 @@ def calculate_system_cost(
     converter_cost: float,
     regulator_cost: float,
     installation_cost: float
-) -> Dict[str, float]:
+) -> CostBreakdown:
     """
     Calculate total system costs breakdown.
-    
+
     Args:
         num_batteries: Number of batteries
         battery_unit_cost: Cost per battery in currency
@@ -80,9 +241,9 @@ def calculate_system_cost(
         converter_cost: Cost of the inverter/converter
         regulator_cost: Cost of the charge controller
         installation_cost: Installation and labor costs
-        
+
     Returns:
-        dict: Breakdown of costs with keys:
+        CostBreakdown: Breakdown of costs with fields:
             - battery_total: Total battery cost
             - pv_total: Total solar panel cost
             - converter: Converter cost
@@ -93,13 +254,111 @@ def calculate_system_cost(
     battery_total = num_batteries * battery_unit_cost
     pv_total = num_pv * pv_unit_cost
     total = battery_total + pv_total + converter_cost + regulator_cost + installation_cost
-    
+
+    return CostBreakdown(
+        battery_total=battery_total,
+        pv_total=pv_total,
+        converter=converter_cost,
+        regulator=regulator_cost,
+        installation=installation_cost,
+        total=total
+    )
+
+
+def size_system(
+    daily_energy_wh: float,
+    battery_voltage: int,
+    battery_capacity_ah: int,
+    autonomy_days: int,
+    discharge_depth: float,
+    pv_power_w: int,
+    sun_hours: float,
+    battery_unit_cost: float,
+    pv_unit_cost: float,
+    converter_cost: float,
+    regulator_cost: float,
+    installation_cost: float
+) -> SystemSizing:
+    """
+    Size batteries and panels and cost the system in one fused call.
+
+    The UI always runs battery_needed, panel_needed and
+    calculate_system_cost back to back on the same inputs; fusing them
+    computes everything in one frame with no intermediate results. The
+    fine-grained functions remain for callers that need only one piece.
+
+    Args:
+        daily_energy_wh: Daily energy consumption in Watt-hours
+        battery_voltage: Battery voltage in Volts
+        battery_capacity_ah: Battery capacity in Amp-hours
+        autonomy_days: Number of days of autonomy required
+        discharge_depth: Depth of discharge (0-1)
+        pv_power_w: Power of one solar panel in Watts
+        sun_hours: Peak sun hours per day
+        battery_unit_cost: Cost per battery in currency
+        pv_unit_cost: Cost per solar panel in currency
+        converter_cost: Cost of the inverter/converter
+        regulator_cost: Cost of the charge controller
+        installation_cost: Installation and labor costs
+
+    Returns:
+        SystemSizing: Battery/panel counts plus the full cost breakdown
+    """
+    num_batteries = ceil(
+        (daily_energy_wh * autonomy_days)
+        / (battery_voltage * battery_capacity_ah * discharge_depth)
+    )
+    num_panels = ceil(daily_energy_wh / (pv_power_w * sun_hours))
+
+    battery_total = num_batteries * battery_unit_cost
+    pv_total = num_panels * pv_unit_cost
+
+    return SystemSizing(
+        num_batteries=num_batteries,
+        num_panels=num_panels,
+        battery_total=battery_total,
+        pv_total=pv_total,
+        converter=converter_cost,
+        regulator=regulator_cost,
+        installation=installation_cost,
+        total=battery_total + pv_total + converter_cost + regulator_cost + installation_cost
+    )
+
+
+def calculate_system_cost_batch(
+    num_batteries,
+    battery_unit_cost,
+    num_pv,
+    pv_unit_cost,
+    converter_cost,
+    regulator_cost,
+    installation_cost
+) -> Dict[str, np.ndarray]:
+    """
+    Vectorized cost breakdown over arrays of configurations.
+
+    Same formula as calculate_system_cost applied to whole configuration
+    matrices in one NumPy pass; any argument may be a scalar or an
+    array-like, broadcast against the others. Computed in float32 —
+    ample for engineering precision, half the memory traffic of
+    float64 on large sweeps.
+
+    Returns:
+        dict: Same keys as calculate_system_cost, each an ndarray
+    """
+    battery_total = np.asarray(num_batteries, dtype=np.float32) * np.asarray(battery_unit_cost, dtype=np.float32)
+    pv_total = np.asarray(num_pv, dtype=np.float32) * np.asarray(pv_unit_cost, dtype=np.float32)
+    converter = np.asarray(converter_cost, dtype=np.float32)
+    regulator = np.asarray(regulator_cost, dtype=np.float32)
+    installation = np.asarray(installation_cost, dtype=np.float32)
+    total = battery_total + pv_total + converter + regulator + installation
+
     return {
         "battery_total": battery_total,
         "pv_total": pv_total,
-        "converter": converter_cost,
-        "regulator": regulator_cost,
-        "installation": installation_cost,
+        "converter": np.broadcast_to(converter, total.shape),
+        "regulator": np.broadcast_to(regulator, total.shape),
+        "installation": np.broadcast_to(installation, total.shape),
         "total": total
     }
 
@@ -108,17 +367,17 @@ def calculate_roi(
     total_cost: float,
     daily_energy_kwh: float,
     electricity_price_per_kwh: float
-) -> Dict[str, float]:
+) -> ROIResult:
     """
     Calculate return on investment and savings.
-    
+
     Args:
         total_cost: Total system cost in currency
         daily_energy_kwh: Daily energy consumption in kWh
         electricity_price_per_kwh: Price of electricity per kWh
-        
+
     Returns:
-        dict: Savings and ROI with keys:
+        ROIResult: Savings and ROI with fields:
             - daily: Daily savings
             - monthly: Monthly savings (30 days)
             - annual: Annual savings (365 days)
@@ -127,49 +386,108 @@ def calculate_roi(
     daily_savings = daily_energy_kwh * electricity_price_per_kwh
     monthly_savings = daily_savings * 30
     annual_savings = daily_savings * 365
-    
+
     roi_years = total_cost / annual_savings if annual_savings > 0 else float('inf')
-    
+
+    return ROIResult(
+        daily=daily_savings,
+        monthly=monthly_savings,
+        annual=annual_savings,
+        roi_years=roi_years
+    )
+
+
+def calculate_roi_batch(
+    total_cost,
+    daily_energy_kwh,
+    electricity_price_per_kwh
+) -> Dict[str, np.ndarray]:
+    """
+    Vectorized ROI and savings over arrays of configurations.
+
+    Same formula as calculate_roi applied in one NumPy pass; any
+    argument may be a scalar or an array-like, broadcast against the
+    others. Configurations without savings get np.inf instead of the
+    scalar branch. Computed in float32.
+
+    Returns:
+        dict: Same keys as calculate_roi, each an ndarray
+    """
+    daily_savings = np.asarray(daily_energy_kwh, dtype=np.float32) * np.asarray(electricity_price_per_kwh, dtype=np.float32)
+    annual_savings = daily_savings * np.float32(365)
+    cost = np.asarray(total_cost, dtype=np.float32)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        roi_years = np.where(annual_savings > 0, cost / annual_savings, np.float32(np.inf))
+
     return {
         "daily": daily_savings,
-        "monthly": monthly_savings,
+        "monthly": daily_savings * 30,
         "annual": annual_savings,
         "roi_years": roi_years
     }
 
 
-def calculate_co2_impact(annual_energy_kwh: float) -> Dict[str, float]:
+def calculate_co2_impact(annual_energy_kwh: float) -> CO2Result:
     """
     Calculate CO2 emissions avoided by using solar energy.
-    
+
     Uses average values:
     - 0.5 kg CO2 per kWh (varies by country and energy mix)
     - 1 tree absorbs ~21 kg CO2 per year
-    
+
     Args:
         annual_energy_kwh: Annual energy consumption in kWh
-        
+
     Returns:
-        dict: CO2 impact with keys:
+        CO2Result: CO2 impact with fields:
             - co2_kg: CO2 avoided in kilograms
             - co2_tons: CO2 avoided in metric tons
             - trees: Equivalent number of trees planted
     """
-    co2_avoided_kg = annual_energy_kwh * 0.5
-    trees_equivalent = co2_avoided_kg / 21
-    
+    co2_avoided_kg = annual_energy_kwh * _KG_CO2_PER_KWH
+
+    return CO2Result(
+        co2_kg=co2_avoided_kg,
+        co2_tons=co2_avoided_kg * _KG_TO_TON,
+        trees=co2_avoided_kg * _INV_TREE_KG
+    )
+
+
+def calculate_co2_impact_batch(annual_energy_kwh) -> Dict[str, np.ndarray]:
+    """
+    Vectorized CO2 impact over arrays of annual energies.
+
+    Same constants as calculate_co2_impact applied in one NumPy pass,
+    in float32.
+
+    Args:
+        annual_energy_kwh: Annual energy consumption(s) in kWh
+
+    Returns:
+        dict: Same keys as calculate_co2_impact, each an ndarray
+    """
+    co2_avoided_kg = np.asarray(annual_energy_kwh, dtype=np.float32) * np.float32(_KG_CO2_PER_KWH)
+
     return {
         "co2_kg": co2_avoided_kg,
-        "co2_tons": co2_avoided_kg / 1000,
-        "trees": trees_equivalent
+        "co2_tons": co2_avoided_kg * np.float32(_KG_TO_TON),
+        "trees": co2_avoided_kg * np.float32(_INV_TREE_KG)
     }
 
 
+def _regulator_core(pv_power: float, battery_voltage: int) -> tuple[float, float]:
+    """Pure-numeric core: nominal and recommended (25% margin) current."""
+    nominal_current = pv_power / battery_voltage
+    return nominal_current, nominal_current * 1.25
+
+
+@lru_cache(maxsize=128)
 def calculate_regulator(
-    pv_power: float, 
-    battery_voltage: int, 
+    pv_power: float,
+    battery_voltage: int,
     regulator_type: str = "MPPT"
-) -> Dict[str, Union[float, str]]:
+) -> RegulatorSpec:
     """
     Calculate charge controller (regulator) specifications.
     
@@ -185,28 +503,73 @@ def calculate_regulator(
         regulator_type: Type of regulator - "MPPT" or "PWM"
         
     Returns:
-        dict: Regulator specifications with keys:
+        RegulatorSpec: Regulator specifications with fields:
             - nominal_current: Nominal current in Amperes
             - recommended_current: Recommended current with 25% safety margin
             - nominal_power: Nominal power in Watts
             - efficiency: Regulator efficiency (0-1)
             - type: Regulator type
+
+    Raises:
+        KeyError: If regulator_type is not "MPPT" or "PWM"
     """
-    # Calculate current with 25% safety margin
-    nominal_current = pv_power / battery_voltage
-    recommended_current = nominal_current * 1.25
-    
+    nominal_current, recommended_current = _regulator_core(pv_power, battery_voltage)
+
     # MPPT is more efficient (can handle higher PV voltage)
     # PWM requires PV voltage close to battery voltage
-    efficiency = 0.98 if regulator_type == "MPPT" else 0.85
-    
-    return {
-        "nominal_current": nominal_current,
-        "recommended_current": recommended_current,
-        "nominal_power": pv_power,
-        "efficiency": efficiency,
-        "type": regulator_type
-    }
+    efficiency = _REGULATOR_EFF[regulator_type]
+
+    return RegulatorSpec(
+        nominal_current=nominal_current,
+        recommended_current=recommended_current,
+        nominal_power=pv_power,
+        efficiency=efficiency,
+        type=regulator_type
+    )
+
+
+def _cable_core(
+    current: float,
+    length: float,
+    voltage: int,
+    max_drop_percent: float
+) -> tuple[float, float, float, int]:
+    """
+    Pure-numeric core of the cable sizing calculation.
+
+    Operates only on scalars so it stays independent of the dict-building
+    wrapper and can be compiled or vectorized as a unit if needed — the
+    body is a handful of float ops plus one binary search, so a JIT could
+    take it over wholesale without touching the callers.
+
+    Returns:
+        tuple: (cable_section, actual_drop_volts, actual_drop_percent, fuse_rating)
+    """
+    # Resistivity of copper at 20°C (Ω·mm²/m)
+    rho_copper = 0.01724
+
+    # Maximum acceptable voltage drop
+    max_drop_volts = voltage * (max_drop_percent / 100)
+
+    # Numerator of S = (2 * ρ * I * L) / ΔV, shared with the actual-drop
+    # formula below. Factor 2 because current goes out and returns.
+    resistance_term = 2 * rho_copper * current * length
+    min_section = resistance_term / max_drop_volts
+
+    # Find the next standard section (binary search instead of linear scan)
+    idx = bisect.bisect_left(_STANDARD_SECTIONS, min_section)
+    cable_section = _STANDARD_SECTIONS[idx] if idx < len(_STANDARD_SECTIONS) else 240.0
+
+    # Calculate actual voltage drop with selected section
+    actual_drop_volts = resistance_term / cable_section
+    actual_drop_percent = (actual_drop_volts / voltage) * 100
+
+    # Fuse rating: 1.25 × nominal current, rounded to the nearest 5 A
+    # (minimum 5 A). Integer arithmetic with an explicit half-up bias
+    # instead of round(), which rounds halves to even.
+    fuse_rating = max(5, int(current * 1.25 + 2.5) // 5 * 5)
+
+    return cable_section, actual_drop_volts, actual_drop_percent, fuse_rating
 
 
 def calculate_cable_section(
@@ -214,7 +577,7 @@ def calculate_cable_section(
     length: float, 
     voltage: int, 
     max_drop_percent: float = 3.0
-) -> Dict[str, float]:
+) -> CableSpec:
     """
     Calculate cable section based on voltage drop requirements.
     
@@ -235,42 +598,62 @@ def calculate_cable_section(
         max_drop_percent: Maximum acceptable voltage drop percentage (default 3%)
         
     Returns:
-        dict: Cable specifications with keys:
+        CableSpec: Cable specifications with fields:
             - cable_section: Selected cable section in mm²
             - actual_drop_volts: Actual voltage drop in Volts
             - actual_drop_percent: Actual voltage drop percentage
             - fuse_rating: Recommended fuse rating in Amperes
             - current: Operating current in Amperes
     """
-    # Resistivity of copper at 20°C (Ω·mm²/m)
-    rho_copper = 0.01724
-    
-    # Maximum acceptable voltage drop
-    max_drop_volts = voltage * (max_drop_percent / 100)
-    
-    # Calculate minimum cable section: S = (2 * ρ * I * L) / ΔV
-    # Factor 2 because current goes out and returns
-    min_section = (2 * rho_copper * current * length) / max_drop_volts
-    
-    # Standard cable sections (mm²) according to IEC standards
-    standard_sections = [1.5, 2.5, 4, 6, 10, 16, 25, 35, 50, 70, 95, 120, 150, 185, 240]
-    
-    # Find the next standard section
-    cable_section = next((s for s in standard_sections if s >= min_section), 240)
-    
-    # Calculate actual voltage drop with selected section
-    actual_drop_volts = (2 * rho_copper * current * length) / cable_section
-    actual_drop_percent = (actual_drop_volts / voltage) * 100
-    
-    # Fuse rating: 1.25 × nominal current, rounded to nearest 5A
-    fuse_rating = round(current * 1.25 / 5) * 5
-    if fuse_rating < 5:
-        fuse_rating = 5
-    
+    cable_section, actual_drop_volts, actual_drop_percent, fuse_rating = _cable_core(
+        current, length, voltage, max_drop_percent
+    )
+
+    return CableSpec(
+        cable_section=cable_section,
+        actual_drop_volts=actual_drop_volts,
+        actual_drop_percent=actual_drop_percent,
+        fuse_rating=fuse_rating,
+        current=current
+    )
+
+
+def calculate_cable_section_batch(
+    current,
+    length,
+    voltage,
+    max_drop_percent=3.0
+) -> Dict[str, np.ndarray]:
+    """
+    Vectorized cable sizing over arrays of circuits.
+
+    Same formulas as calculate_cable_section applied to all circuits in
+    one NumPy pass; any argument may be a scalar or an array-like,
+    broadcast against the others. Section selection runs through
+    np.searchsorted on the IEC table instead of a per-circuit search.
+    Computed in float32.
+
+    Returns:
+        dict: Same keys as calculate_cable_section, each an ndarray
+    """
+    current = np.asarray(current, dtype=np.float32)
+    length = np.asarray(length, dtype=np.float32)
+    voltage = np.asarray(voltage, dtype=np.float32)
+    max_drop_percent = np.asarray(max_drop_percent, dtype=np.float32)
+
+    resistance_term = np.float32(2.0 * 0.01724) * current * length
+    min_section = resistance_term / (voltage * (max_drop_percent / np.float32(100.0)))
+
+    idx = np.minimum(np.searchsorted(_IEC_SECTIONS, min_section), len(_IEC_SECTIONS) - 1)
+    cable_section = _IEC_SECTIONS[idx].astype(np.float32)
+    actual_drop_volts = resistance_term / cable_section
+
+    fuse_rating = np.maximum(5, (current * 1.25 + 2.5).astype(np.int64) // 5 * 5)
+
     return {
         "cable_section": cable_section,
         "actual_drop_volts": actual_drop_volts,
-        "actual_drop_percent": actual_drop_percent,
+        "actual_drop_percent": actual_drop_volts / voltage * np.float32(100.0),
         "fuse_rating": fuse_rating,
         "current": current
     }
@@ -5,30 +5,219 @@ This module contains functions to create interactive Plotly charts for
 visualizing energy consumption, power profiles, and hourly patterns.
 """
 
-from typing import Dict, Any, TYPE_CHECKING
+from dataclasses import dataclass
+from typing import Dict, Any, Optional, TYPE_CHECKING
+import numpy as np
+import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 
 if TYPE_CHECKING:
     from models import EquipmentFactory
 
+# Series longer than this are downsampled before being handed to Plotly;
+# the browser cannot display more points than it has pixels anyway.
+_MAX_CHART_POINTS = 1000
 
-def create_consumption_pie_chart(factory: "EquipmentFactory", t: Dict[str, Any]) -> go.Figure:
+# Invariant layout fragments, built once at import. Only the translated
+# titles differ between calls, so the builders merge these constants
+# instead of reconstructing the same dicts on every Streamlit rerun.
+_LEGEND_TOP_LEFT = dict(x=0.01, y=0.99)
+_HOURLY_XAXIS = dict(tickmode='linear', tick0=0, dtick=2, range=[-0.5, 23.5])
+
+# Beyond this many pie slices the labels overlap and the smallest
+# wedges are unreadable; the tail is folded into a single "Other" slice.
+_MAX_PIE_SLICES = 15
+
+
+def downsample(x, y, n_out: int = 1000) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Downsample a series with largest-triangle-three-buckets (LTTB).
+
+    Keeps the first and last points and, for each interior bucket, the
+    point forming the largest triangle with the previously selected
+    point and the next bucket's average — preserving visual peaks far
+    better than naive striding.
+
+    Args:
+        x: X values (monotonic)
+        y: Y values, same length as x
+        n_out: Number of points to keep
+
+    Returns:
+        tuple: (x, y) as ndarrays of length min(len(x), n_out)
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(x)
+    if n <= n_out or n_out < 3:
+        return x, y
+
+    # Interior bucket boundaries; first and last points always survive
+    bounds = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = bounds[i], bounds[i + 1]
+        next_lo = bounds[i + 1]
+        next_hi = bounds[i + 2] if i + 2 < len(bounds) else n
+        avg_x = x[next_lo:next_hi].mean()
+        avg_y = y[next_lo:next_hi].mean()
+        areas = np.abs(
+            (x[a] - avg_x) * (y[lo:hi] - y[a])
+            - (x[a] - x[lo:hi]) * (avg_y - y[a])
+        )
+        a = lo + int(areas.argmax())
+        indices[i + 1] = a
+
+    return x[indices], y[indices]
+
+
+def m4_downsample(x, y, n_out: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Downsample a series with M4 (first/min/max/last per bucket).
+
+    Splits the series into n_out/4 buckets and keeps, per bucket, the
+    first, minimum, maximum, and last points in x order. At one bucket
+    per rendered pixel column this is visually lossless for line
+    charts: the pixels a line can light up are fully determined by
+    those four values.
+
+    Args:
+        x: X values (monotonic)
+        y: Y values, same length as x
+        n_out: Target point budget (four per bucket)
+
+    Returns:
+        tuple: (x, y) as ndarrays of at most n_out points
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(x)
+    if n <= n_out or n_out < 8:
+        return x, y
+
+    bounds = np.linspace(0, n, n_out // 4 + 1).astype(np.int64)
+    keep: list[int] = []
+    for lo, hi in zip(bounds[:-1], bounds[1:]):
+        if lo == hi:
+            continue
+        segment = y[lo:hi]
+        picks = {0, int(segment.argmin()), int(segment.argmax()), hi - lo - 1}
+        keep.extend(lo + p for p in sorted(picks))
+    indices = np.unique(np.array(keep, dtype=np.int64))
+    return x[indices], y[indices]
+
+
+def hourly_profile_df(factory: "EquipmentFactory") -> pd.DataFrame:
+    """
+    Get the total hourly profile as a single-column DataFrame.
+
+    Suited to Streamlit's native st.line_chart / st.bar_chart, which use
+    the lightweight Vega-Lite pipeline and transfer a fraction of the
+    bytes of an equivalent Plotly figure.
+
+    Args:
+        factory: EquipmentFactory instance with equipment data
+
+    Returns:
+        pd.DataFrame: 24 rows indexed by hour, one consumption column
+    """
+    return pd.DataFrame(
+        {"Consumption (W)": factory.get_hourly_profile()},
+        index=range(24)
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class ChartData:
+    """
+    Pre-extracted chart inputs shared by the three chart builders.
+
+    One pass over the factory yields every array the builders need, in
+    the float32 layout Plotly transports as base64 typed arrays. A page
+    that renders several charts per rerun prepares this once and passes
+    it to each builder instead of letting each one re-query the factory.
+
+    Attributes:
+        names: Equipment names, in factory order
+        power: Power per equipment in Watts
+        usage_time: Daily usage per equipment in hours
+        energie: Daily energy per equipment in Watt-hours
+        hourly_matrix: (N, 24) per-equipment hourly consumption rows
+        profile: 24-value total hourly consumption (matrix column sums)
+    """
+    names: tuple[str, ...]
+    power: np.ndarray
+    usage_time: np.ndarray
+    energie: np.ndarray
+    hourly_matrix: np.ndarray
+    profile: np.ndarray
+
+
+def prepare_chart_data(factory: "EquipmentFactory") -> ChartData:
+    """
+    Extract all chart inputs from a factory in a single pass.
+
+    Args:
+        factory: EquipmentFactory instance with equipment data
+
+    Returns:
+        ChartData: Frozen bundle of float32 arrays for the builders
+    """
+    cols = factory.columns()
+    equipments = factory.get_equipments()
+    if equipments:
+        hourly_matrix = np.vstack(
+            [eq.get_hourly_consumption() for eq in equipments]
+        ).astype(np.float32)
+    else:
+        hourly_matrix = np.zeros((0, 24), dtype=np.float32)
+    return ChartData(
+        names=tuple(cols["name"]),
+        power=cols["power"].astype(np.float32),
+        usage_time=cols["time"].astype(np.float32),
+        energie=(cols["power"] * cols["time"]).astype(np.float32),
+        hourly_matrix=hourly_matrix,
+        profile=hourly_matrix.sum(axis=0),
+    )
+
+
+def create_consumption_pie_chart(
+    factory: "EquipmentFactory",
+    t: Dict[str, Any],
+    data: Optional[ChartData] = None,
+) -> go.Figure:
     """
     Create a pie chart showing energy consumption distribution by equipment.
-    
+
     Args:
         factory: EquipmentFactory instance with equipment data
         t: Translation dictionary
-        
+        data: Prepared chart inputs; pass the result of
+            prepare_chart_data when building several charts per rerun
+
     Returns:
         go.Figure: Plotly figure with pie chart
     """
-    df = factory.df_datas()
+    if data is None:
+        data = prepare_chart_data(factory)
+    values = data.energie
+    names: Any = list(data.names)
+    if len(names) > _MAX_PIE_SLICES:
+        # Keep the largest consumers as their own slices and fold the
+        # long tail into one aggregate slice.
+        order = np.argsort(values)[::-1]
+        top = order[:_MAX_PIE_SLICES - 1]
+        other_total = values[order[_MAX_PIE_SLICES - 1:]].sum()
+        values = np.append(values[top], np.float32(other_total))
+        names = [names[i] for i in top] + [t["Charts"].get("other", "Other")]
     fig = px.pie(
-        df,
-        values="Energie",
-        names="Name",
+        values=values,
+        names=names,
         title=t["Charts"]["consumption_subtitle"],
         hole=0.4,
         color_discrete_sequence=px.colors.qualitative.Set3
@@ -38,39 +227,47 @@ def create_consumption_pie_chart(factory: "EquipmentFactory", t: Dict[str, Any])
     return fig
 
 
-def create_power_time_chart(factory: "EquipmentFactory", t: Dict[str, Any]) -> go.Figure:
+def create_power_time_chart(
+    factory: "EquipmentFactory",
+    t: Dict[str, Any],
+    data: Optional[ChartData] = None,
+) -> go.Figure:
     """
     Create a grouped bar chart showing power and time for each equipment.
-    
+
     Uses dual y-axes to display both power (W) and usage time (h) on the
     same chart with different scales.
-    
+
     Args:
         factory: EquipmentFactory instance with equipment data
         t: Translation dictionary
-        
+        data: Prepared chart inputs; pass the result of
+            prepare_chart_data when building several charts per rerun
+
     Returns:
         go.Figure: Plotly figure with grouped bar chart
     """
-    df = factory.df_datas()
-    
+    if data is None:
+        data = prepare_chart_data(factory)
+
     fig = go.Figure()
-    
+    names = list(data.names)
+
     # Add power bars
     fig.add_trace(go.Bar(
         name=t["Charts"]["power"],
-        x=df["Name"],
-        y=df["Power"],
+        x=names,
+        y=data.power,
         marker_color='lightblue',
         yaxis='y',
         offsetgroup=1
     ))
-    
+
     # Add time bars
     fig.add_trace(go.Bar(
         name=t["Charts"]["time"],
-        x=df["Name"],
-        y=df["Usage Time"],
+        x=names,
+        y=data.usage_time,
         marker_color='lightcoral',
         yaxis='y2',
         offsetgroup=2
@@ -83,38 +280,70 @@ def create_power_time_chart(factory: "EquipmentFactory", t: Dict[str, Any]) -> g
         yaxis2=dict(title=t["Charts"]["time"], overlaying='y', side='right'),
         barmode='group',
         height=400,
-        legend=dict(x=0.01, y=0.99)
+        legend=_LEGEND_TOP_LEFT
     )
     
     return fig
 
 
-def create_hourly_profile_chart(factory: "EquipmentFactory", t: Dict[str, Any]) -> go.Figure:
+def create_hourly_profile_chart(
+    factory: "EquipmentFactory",
+    t: Dict[str, Any],
+    data: Optional[ChartData] = None,
+    max_equipment_traces: int = 15,
+    downsample_to: Optional[int] = None,
+) -> go.Figure:
     """
     Create an interactive line chart showing hourly consumption profile over 24 hours.
-    
+
     The chart includes:
     - Area chart for total consumption
     - Individual equipment traces (hidden by default)
     - Peak consumption line with annotation
     - Average consumption line with annotation
-    
+
     Args:
         factory: EquipmentFactory instance with equipment data
         t: Translation dictionary
-        
+        data: Prepared chart inputs; pass the result of
+            prepare_chart_data when building several charts per rerun
+        max_equipment_traces: Above this many equipments, the hidden
+            per-equipment traces are omitted entirely: even at
+            visible='legendonly' each one costs payload and legend
+            layout, and a 30-entry legend is unusable anyway
+        downsample_to: Point budget for the aggregate trace. Profiles
+            longer than this (multi-day views) are reduced with M4
+            first/min/max/last binning; None keeps the LTTB fallback
+            that only kicks in past _MAX_CHART_POINTS
+
     Returns:
         go.Figure: Plotly figure with hourly profile chart
     """
-    hourly_profile = factory.get_hourly_profile()
-    hours = list(range(24))
-    
+    # The prepared bundle carries the stacked (N, 24) matrix: the total
+    # is its axis-0 sum and each dotted trace is a row view, so Plotly
+    # gets contiguous float32 arrays for base64 typed-array transport.
+    if data is None:
+        data = prepare_chart_data(factory)
+    hourly_matrix = data.hourly_matrix
+    hourly_profile = data.profile
+    hours = np.arange(len(hourly_profile), dtype=np.int16)
+
+    # The 24-point daily profile passes through untouched; only a future
+    # finer-grained profile (e.g. per-minute) would be reduced here.
+    total_x, total_y = hours, hourly_profile
+    if downsample_to is not None and len(hourly_profile) > downsample_to:
+        total_x, total_y = m4_downsample(hours, hourly_profile, downsample_to)
+    elif len(hourly_profile) > _MAX_CHART_POINTS:
+        total_x, total_y = downsample(hours, hourly_profile, _MAX_CHART_POINTS)
+
     fig = go.Figure()
-    
-    # Add area chart for total consumption
-    fig.add_trace(go.Scatter(
-        x=hours,
-        y=hourly_profile,
+
+    # Add area chart for total consumption. Scattergl renders through
+    # WebGL, which keeps legend toggling fast once the per-equipment
+    # traces pile up instead of bloating the SVG DOM.
+    fig.add_trace(go.Scattergl(
+        x=total_x,
+        y=total_y,
         mode='lines',
         name=t["Hourly"]["consumption"],
         fill='tozeroy',
@@ -122,24 +351,35 @@ def create_hourly_profile_chart(factory: "EquipmentFactory", t: Dict[str, Any])
         hovertemplate='<b>%{x}h</b><br>%{y:.0f} W<extra></extra>'
     ))
     
-    # Add individual equipment traces
+    # Add individual equipment traces (only while the legend stays usable).
+    # Bind the loop invariants to locals so each iteration skips the
+    # repeated global/attribute lookups.
     colors = px.colors.qualitative.Set2
-    for idx, equipment in enumerate(factory.get_equipments()):
-        hourly = equipment.get_hourly_consumption()
-        fig.add_trace(go.Scatter(
+    n_colors = len(colors)
+    add_trace = fig.add_trace
+    scattergl = go.Scattergl
+    traced = data.names if len(data.names) <= max_equipment_traces else ()
+    for idx, eq_name in enumerate(traced):
+        add_trace(scattergl(
             x=hours,
-            y=hourly,
+            y=hourly_matrix[idx],
             mode='lines',
-            name=equipment.name,
-            line=dict(color=colors[idx % len(colors)], width=1, dash='dot'),
+            name=eq_name,
+            line=dict(color=colors[idx % n_colors], width=1, dash='dot'),
             visible='legendonly',  # Hidden by default
-            hovertemplate=f'<b>{equipment.name}</b><br>%{{x}}h: %{{y:.0f}} W<extra></extra>'
+            hovertemplate=f'<b>{eq_name}</b><br>%{{x}}h: %{{y:.0f}} W<extra></extra>'
         ))
     
-    # Calculate peak and average
-    peak_consumption = max(hourly_profile) if hourly_profile else 0
-    avg_consumption = sum(hourly_profile) / 24 if hourly_profile else 0
-    peak_hour = hourly_profile.index(peak_consumption) if peak_consumption > 0 else 0
+    # Calculate peak and average with vectorized reductions; locating the
+    # peak via argmax also avoids a float equality scan for its index
+    if hourly_profile.size:
+        peak_hour = int(hourly_profile.argmax())
+        peak_consumption = float(hourly_profile[peak_hour])
+        avg_consumption = float(hourly_profile.mean())
+    else:
+        peak_hour = 0
+        peak_consumption = 0.0
+        avg_consumption = 0.0
     
     # Add peak line
     fig.add_hline(
@@ -161,17 +401,11 @@ def create_hourly_profile_chart(factory: "EquipmentFactory", t: Dict[str, Any])
     
     fig.update_layout(
         title=t["Hourly"]["chart_title"],
-        xaxis=dict(
-            title=t["Hourly"]["hour"],
-            tickmode='linear',
-            tick0=0,
-            dtick=2,
-            range=[-0.5, 23.5]
-        ),
+        xaxis={**_HOURLY_XAXIS, "title": t["Hourly"]["hour"]},
         yaxis=dict(title=t["Hourly"]["consumption"]),
         height=500,
         hovermode='x unified',
-        legend=dict(x=0.01, y=0.99)
+        legend=_LEGEND_TOP_LEFT
     )
     
     return fig
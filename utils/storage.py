@@ -5,6 +5,8 @@ This module handles saving, loading, and managing configurations and equipment l
 """
 
 import json
+import os
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 from typing import List, Dict, Any, TYPE_CHECKING
@@ -17,35 +19,56 @@ STORAGE_DIR = Path("saved_configs")
 STORAGE_DIR.mkdir(exist_ok=True)
 
 
-def save_configuration(name: str, factory: "EquipmentFactory") -> None:
+def save_configuration(name: str, factory: "EquipmentFactory", pretty: bool = False) -> None:
     """
     Save current equipment configuration to JSON file.
-    
+
     Args:
         name: Name for the configuration
         factory: EquipmentFactory instance with equipment data
-        
+        pretty: Indent the JSON for hand editing. The compact default
+            roughly halves the byte count and encoder work; the files
+            are normally only read back by load_configuration.
+
     The configuration includes:
     - Configuration name
     - Timestamp
     - List of all equipment with their properties
     """
+    # Zip the factory's column arrays instead of reading four attributes
+    # off every equipment object.
+    cols = factory.columns()
     config = {
         "name": name,
         "timestamp": datetime.now().isoformat(),
         "equipments": [
             {
-                "name": eq.name,
-                "power": eq.power,
-                "time": eq.time,
-                "start_hour": eq.start_hour
+                "name": eq_name,
+                "power": power,
+                "time": time,
+                "start_hour": start_hour
             }
-            for eq in factory.get_equipments()
+            for eq_name, power, time, start_hour in zip(
+                cols["name"],
+                cols["power"].tolist(),
+                cols["time"].tolist(),
+                cols["start_hour"].tolist()
+            )
         ]
     }
     file_path = STORAGE_DIR / f"{name}.json"
-    with open(file_path, "w", encoding="utf-8") as f:
-        json.dump(config, f, indent=2, ensure_ascii=False)
+    # Serialize to one string and write it in a single call instead of
+    # streaming through json.dump's many small file.write() calls.
+    if pretty:
+        payload = json.dumps(config, indent=2, ensure_ascii=False)
+    else:
+        payload = json.dumps(config, ensure_ascii=False, separators=(",", ":"))
+    # Write to a sibling temp file and rename over the target: the
+    # rename is atomic, so an interrupted save can never leave a
+    # half-written file for the next load_configuration to choke on.
+    tmp_path = file_path.with_suffix(".json.tmp")
+    tmp_path.write_text(payload, encoding="utf-8")
+    os.replace(tmp_path, file_path)
 
 
 def load_configuration(name: str) -> List[Dict[str, Any]]:
@@ -64,8 +87,9 @@ def load_configuration(name: str) -> List[Dict[str, Any]]:
         json.JSONDecodeError: If configuration file is malformed
     """
     file_path = STORAGE_DIR / f"{name}.json"
-    with open(file_path, "r", encoding="utf-8") as f:
-        config = json.load(f)
+    # json.loads on bytes stays in the C scanner end-to-end; reading the
+    # whole file at once also skips the buffered text-decoding layer.
+    config = json.loads(file_path.read_bytes())
     return config["equipments"]
 
 
@@ -76,7 +100,13 @@ def get_saved_configurations() -> List[str]:
     Returns:
         list[str]: List of configuration names (without .json extension)
     """
-    return [f.stem for f in STORAGE_DIR.glob("*.json")]
+    # os.scandir reads the directory in one pass without building a Path
+    # (and stat-ing it) per entry the way Path.glob does.
+    return [
+        entry.name[:-5]
+        for entry in os.scandir(STORAGE_DIR)
+        if entry.name.endswith(".json") and entry.is_file()
+    ]
 
 
 def delete_configuration(name: str) -> None:
@@ -91,13 +121,26 @@ def delete_configuration(name: str) -> None:
         file_path.unlink()
 
 
+@lru_cache(maxsize=4)
+def _load_library_cached(path_str: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse the library file, cached per (path, mtime) pair.
+
+    The mtime key means an edited library file is re-read on the next
+    call while unchanged files keep hitting the cache.
+    """
+    return json.loads(Path(path_str).read_bytes())
+
+
 def load_equipment_library() -> Dict[str, Any]:
     """
     Load equipment library from JSON file.
-    
+
     The library contains pre-configured equipment organized by categories
     (kitchen, electronics, lighting, etc.) with power, time, and description.
-    
+    The parsed library is cached keyed on the file's mtime, so repeated
+    calls (e.g. on every sidebar draw) don't re-read and re-parse the
+    JSON file, while edits to the file still take effect immediately.
+
     Returns:
         dict: Equipment library with structure:
             {
@@ -113,8 +156,9 @@ def load_equipment_library() -> Dict[str, Any]:
     """
     library_path = Path("equipment_library.json")
     if library_path.exists():
-        with open(library_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return _load_library_cached(
+            str(library_path), library_path.stat().st_mtime_ns
+        )
     return {"categories": {}}
 
 
@@ -122,10 +166,15 @@ def get_library_categories(library: Dict[str, Any], lang: str) -> Dict[str, Any]
     """
     Get categories with translated names based on language.
     
+    The translated dict is memoized per language inside the library
+    dict itself. The library is read-only after load and is shared via
+    the mtime cache, so repeated calls on Streamlit reruns return the
+    same dict instead of rebuilding it.
+
     Args:
         library: Equipment library dictionary
         lang: Language code (e.g., 'en', 'fr')
-        
+
     Returns:
         dict: Categories with translated names and items:
             {
@@ -136,6 +185,11 @@ def get_library_categories(library: Dict[str, Any], lang: str) -> Dict[str, Any]
                 }
             }
     """
+    cache = library.setdefault("_categories_cache", {})
+    categories = cache.get(lang)
+    if categories is not None:
+        return categories
+
     categories = {}
     for cat_id, cat_data in library.get("categories", {}).items():
         name_key = f"name_{lang}"
@@ -144,4 +198,5 @@ def get_library_categories(library: Dict[str, Any], lang: str) -> Dict[str, Any]
             "icon": cat_data.get("icon", ""),
             "items": cat_data.get("items", [])
         }
+    cache[lang] = categories
     return categories
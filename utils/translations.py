@@ -5,10 +5,13 @@ This module handles loading and managing translations for different languages.
 """
 
 import json
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any
 
 
+@lru_cache(maxsize=8)
 def load_translation(language_code: str) -> Dict[str, Any]:
     """
     Load translation file for the specified language.
@@ -17,8 +20,10 @@ def load_translation(language_code: str) -> Dict[str, Any]:
         language_code: ISO 639-1 language code (e.g., 'en', 'fr', 'es')
         
     Returns:
-        dict: Translation dictionary with all text strings
-        
+        dict: Translation dictionary with all text strings.
+              The result is cached per language code, so the JSON file
+              is only read and parsed once per process.
+
     Raises:
         FileNotFoundError: If translation file doesn't exist
         json.JSONDecodeError: If translation file is malformed
@@ -28,23 +33,58 @@ def load_translation(language_code: str) -> Dict[str, Any]:
     if not translation_path.exists():
         raise FileNotFoundError(f"Translation file not found: {translation_path}")
     
-    with open(translation_path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    # Parse straight from bytes: json.loads handles UTF-8 natively and
+    # skips the intermediate text-mode decode of open(..., "r").
+    return json.loads(translation_path.read_bytes())
+
+
+def flatten_translation(translation: Dict[str, Any]) -> Dict[str, str]:
+    """
+    Flatten a nested translation dict into single-lookup keys.
+
+    Nested sections like {"Battery": {"dod": "..."}} become
+    {"Battery.dod": "..."}, so a label lookup is one dict.get instead
+    of two chained .get calls with a throwaway fallback dict.
+
+    Args:
+        translation: Nested translation dictionary from load_translation
+
+    Returns:
+        dict: Flat mapping of "Section.key" (or top-level key) to text
+    """
+    flat: Dict[str, str] = {}
+    for key, value in translation.items():
+        if isinstance(value, dict):
+            for sub_key, sub_value in value.items():
+                flat[f"{key}.{sub_key}"] = sub_value
+        else:
+            flat[key] = value
+    return flat
+
+
+@lru_cache(maxsize=4)
+def _scan_languages(mtime_ns: int) -> tuple[str, ...]:
+    """Scan the locals directory, cached per directory mtime.
+
+    Adding or removing a translation file bumps the directory mtime,
+    so the next call rescans; otherwise the cached tuple is returned.
+    """
+    return tuple(
+        entry.name[:-5]
+        for entry in os.scandir("locals")
+        if entry.name.endswith(".json") and entry.is_file()
+    )
 
 
 def get_available_languages() -> list[str]:
     """
     Get list of available language codes.
-    
+
     Returns:
         list[str]: List of ISO 639-1 language codes
     """
     locals_path = Path("locals")
     if not locals_path.exists():
         return []
-    
-    # Find all .json files in locals directory
-    language_files = locals_path.glob("*.json")
-    
-    # Extract language codes from filenames
-    return [f.stem for f in language_files]
+
+    return list(_scan_languages(locals_path.stat().st_mtime_ns))